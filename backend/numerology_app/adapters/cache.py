@@ -1,8 +1,10 @@
-﻿from typing import Optional
+﻿from typing import Optional, Union
+
+CacheValue = Union[str, bytes, dict]
 
 class BaseCache:
-    async def get(self, key: str) -> Optional[dict]: ...
-    async def set(self, key: str, value: dict, ttl: int = 0) -> None: ...
+    async def get(self, key: str) -> Optional[CacheValue]: ...
+    async def set(self, key: str, value: CacheValue, ttl: int = 0) -> None: ...
 
 class InMemoryCache(BaseCache):
     def __init__(self):
@@ -11,5 +13,5 @@ class InMemoryCache(BaseCache):
     async def get(self, key: str):
         return self._store.get(key)
 
-    async def set(self, key: str, value: dict, ttl: int = 0):
+    async def set(self, key: str, value: CacheValue, ttl: int = 0):
         self._store[key] = value
@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 from datetime import date, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 # Astral imports (supporting both v2/v3 styles)
@@ -10,12 +11,16 @@ except ImportError:  # pragma: no cover
 
 from astral.sun import sun
 
+@lru_cache(maxsize=64)
+def _zone(tz: str) -> ZoneInfo:
+    return ZoneInfo(tz)
+
 def solar_events(d: date, lat: float, lon: float, tz: str) -> tuple[datetime, datetime]:
     """
     Compute local sunrise and sunset (timezone-aware) using Astral.
     Returns (sunrise_dt, sunset_dt) as aware datetimes.
     """
-    tzinfo = ZoneInfo(tz)
+    tzinfo = _zone(tz)
 
     if Observer is not None:
         obs = Observer(latitude=lat, longitude=lon)
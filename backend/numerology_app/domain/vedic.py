@@ -14,22 +14,22 @@ def _segment_window(sr: datetime, ss: datetime, segment_number_1based: int) -> t
     end = start + part
     return start, end
 
+# Standard mapping of segment positions (1..8)
+# Sources describe: divide sunrise->sunset into 8 equal parts. Rahu/Yama/Gulika
+# occupy fixed segment numbers per weekday. (See product docs/citations in app.)
+_RAHU_SEGMENT   = (2, 7, 5, 6, 4, 3, 8)  # Mon..Sun
+_YAMA_SEGMENT   = (4, 3, 2, 1, 7, 6, 5)  # Mon..Sun
+_GULIKA_SEGMENT = (6, 5, 4, 3, 2, 1, 7)  # Mon..Sun
+
 def day_segments(sr: datetime, ss: datetime, weekday: int) -> tuple[str, str, str]:
     """
     Compute Rahu Kaal, Yamagandam, and Gulika windows for a given weekday.
     `weekday` is Python's date.weekday(): Monday=0 .. Sunday=6.
     Returns strings like 'HH:MM-HH:MM'.
     """
-    # Standard mapping of segment positions (1..8)
-    # Sources describe: divide sunrise->sunset into 8 equal parts. Rahu/Yama/Gulika
-    # occupy fixed segment numbers per weekday. (See product docs/citations in app.)
-    rahu_map      = [2, 7, 5, 6, 4, 3, 8]  # Mon..Sun
-    yama_map      = [4, 3, 2, 1, 7, 6, 5]  # Mon..Sun
-    gulika_map    = [6, 5, 4, 3, 2, 1, 7]  # Mon..Sun
-
-    r_start, r_end = _segment_window(sr, ss, rahu_map[weekday])
-    y_start, y_end = _segment_window(sr, ss, yama_map[weekday])
-    g_start, g_end = _segment_window(sr, ss, gulika_map[weekday])
+    r_start, r_end = _segment_window(sr, ss, _RAHU_SEGMENT[weekday])
+    y_start, y_end = _segment_window(sr, ss, _YAMA_SEGMENT[weekday])
+    g_start, g_end = _segment_window(sr, ss, _GULIKA_SEGMENT[weekday])
 
     def f(a: datetime, b: datetime) -> str:
         return f"{a.strftime('%H:%M')}-{b.strftime('%H:%M')}"
@@ -0,0 +1,14 @@
+# backend/numerology_app/ephe.py
+"""
+Shared Swiss Ephemeris handle.
+
+The ephemeris path is process-wide state, so it is set once here, on
+first import. Modules that use the Swiss Ephemeris import ``swe`` from
+this module rather than importing swisseph themselves.
+"""
+
+import swisseph as swe
+
+swe.set_ephe_path()
+
+__all__ = ["swe"]
@@ -0,0 +1,59 @@
+# backend/numerology_app/health_interceptor.py
+"""
+Pure ASGI health check interceptor.
+
+Answers /healthz and /api/healthz before the request reaches FastAPI, so
+liveness probes skip routing and response-model handling. OPTIONS and
+everything else is passed through to the wrapped app unchanged; CORS is
+applied outside this wrapper (see main.py).
+"""
+
+from typing import Any, Awaitable, Callable, Dict
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Pre-encoded bodies, byte-identical to what the FastAPI routes returned
+_BODIES = {
+    "/healthz": b'{"ok":true}',
+    "/api/healthz": b'{"ok":true,"status":"healthy","service":"numerology-api"}',
+}
+_METHOD_NOT_ALLOWED = b'{"detail":"Method Not Allowed"}'
+
+
+def _response(status: int, body: bytes, *extra_headers):
+    """Prebuilt (start, body, empty body) ASGI messages for a fixed JSON response."""
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *extra_headers,
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}, {"type": "http.response.body", "body": b""}
+
+
+# The payloads never change, so every message is built once at import
+_OK = {path: _response(200, body) for path, body in _BODIES.items()}
+_NOT_ALLOWED = _response(405, _METHOD_NOT_ALLOWED, (b"allow", b"GET, HEAD"))
+
+
+class HealthCheckInterceptor:
+    """ASGI wrapper serving the health endpoints without entering ``app``."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in _OK or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        start, body, empty = _OK[scope["path"]] if method in ("GET", "HEAD") else _NOT_ALLOWED
+        await send(start)
+        await send(empty if method == "HEAD" else body)
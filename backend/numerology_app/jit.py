@@ -0,0 +1,49 @@
+# backend/numerology_app/jit.py
+"""
+Optional numba JIT for the NumPy batch kernels, resolved on first use.
+
+Importing numba takes a few hundred milliseconds, so modules that define
+kernels don't import it themselves: they decorate the kernel with
+``lazy_njit`` and numba is imported (and the kernel compiled) on the first
+call. Without numba the kernel runs as plain Python.
+
+Kernels write their parallel loops with this module's ``prange``; it is a
+plain ``range`` until the kernel is compiled, when the kernel module's
+``prange`` is rebound to ``numba.prange``.
+"""
+
+import functools
+import importlib.util
+
+prange = range
+
+
+@functools.lru_cache(maxsize=1)
+def has_numba() -> bool:
+    """Whether numba is installed, checked without importing it."""
+    return importlib.util.find_spec("numba") is not None
+
+
+def lazy_njit(**options):
+    """``numba.njit(**options)``, applied on the kernel's first call."""
+    def decorate(kernel):
+        compiled = None
+
+        @functools.wraps(kernel)
+        def wrapper(*args):
+            nonlocal compiled
+            if compiled is None:
+                compiled = _compile(kernel, options)
+            return compiled(*args)
+
+        return wrapper
+    return decorate
+
+
+def _compile(kernel, options):
+    if not has_numba():
+        return kernel
+    import numba
+
+    kernel.__globals__["prange"] = numba.prange
+    return numba.njit(**options)(kernel)
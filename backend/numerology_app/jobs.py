@@ -13,12 +13,15 @@ import json
 import asyncio
 from dataclasses import dataclass
 
+import orjson
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import redis.asyncio as redis
+from fastapi.encoders import jsonable_encoder
 
 from .config import settings
 from .panchangam.core import assemble_panchangam
+from .panchangam.astronomy import refresh_longitude_table
 from .festivals.service import festival_service
 from .models import PanchangDay, FestivalDay
 from .db import SessionLocal
@@ -158,6 +161,9 @@ class PrecomputeJob:
         
         logger.info(f"Starting panchangam precomputation for {len(self.cities)} cities")
         
+        # Roll the sun/moon longitude table over to today before the batch
+        refresh_longitude_table()
+        
         # Calculate date range
         today = date.today()
         end_date = today + timedelta(days=settings.PRECOMPUTE_DAYS)
@@ -210,6 +216,7 @@ class PrecomputeJob:
     async def _precompute_city_panchangam(self, city: City, start_date: date, end_date: date) -> int:
         """Precompute panchangam data for a specific city."""
         count = 0
+        rows: List[Dict[str, Any]] = []
         current_date = start_date
         
         while current_date <= end_date:
@@ -236,12 +243,17 @@ class PrecomputeJob:
                 if self.redis_client:
                     await self.redis_client.set(
                         cache_key, 
-                        json.dumps(panchangam_data, default=str), 
+                        orjson.dumps(panchangam_data, default=str), 
                         ex=86400 * 7  # 7 days
                     )
                 
-                # Store in database (optional)
-                await self._store_panchangam_to_db(panchangam_data, city)
+                # Queue for database storage (written in one batch below).
+                # Polar days/nights have no sunrise/sunset, which the NOT NULL
+                # columns reject; one such row would fail the whole batch.
+                if panchangam_data["sunrise"] is None or panchangam_data["sunset"] is None:
+                    logger.warning(f"No sunrise/sunset for {city.name} on {current_date}; not storing to database")
+                else:
+                    rows.append(self._panchang_day_row(panchangam_data, city))
                 
                 count += 1
                 current_date += timedelta(days=1)
@@ -251,6 +263,9 @@ class PrecomputeJob:
                 current_date += timedelta(days=1)
                 continue
         
+        # Store in database (optional)
+        await self._store_panchangam_to_db(rows)
+        
         return count
     
     async def _precompute_city_festivals(self, city: City, start_date: date, end_date: date) -> int:
@@ -352,47 +367,54 @@ class PrecomputeJob:
         }
         return region_mapping.get(city.state, "ALL")
     
-    async def _store_panchangam_to_db(self, panchangam_data: Dict[str, Any], city: City):
-        """Store panchangam data to database."""
+    def _panchang_day_row(self, panchangam_data: Dict[str, Any], city: City) -> Dict[str, Any]:
+        """Build a panchang_days row from assembled panchangam data."""
+        return {
+            "date": date.fromisoformat(panchangam_data["date"]),
+            "latitude": city.latitude,
+            "longitude": city.longitude,
+            "timezone": city.timezone,
+            "sunrise": panchangam_data["sunrise"],
+            "sunset": panchangam_data["sunset"],
+            "tithi_number": panchangam_data["tithi"]["number"],
+            "tithi_name": panchangam_data["tithi"]["name"],
+            "tithi_progress": panchangam_data["tithi"]["progress"],
+            "nakshatra_number": panchangam_data["nakshatra"]["number"],
+            "nakshatra_name": panchangam_data["nakshatra"]["name"],
+            "nakshatra_progress": panchangam_data["nakshatra"]["progress"],
+            "yoga_number": panchangam_data["yoga"]["number"],
+            "yoga_name": panchangam_data["yoga"]["name"],
+            "yoga_progress": panchangam_data["yoga"]["progress"],
+            "karana_name": panchangam_data["karana"]["name"],
+            "karana_progress": panchangam_data["karana"]["progress"],
+            # JSON columns: datetimes become ISO strings
+            "rahu_kalam": jsonable_encoder(panchangam_data["rahu_kalam"]),
+            "yama_gandam": jsonable_encoder(panchangam_data["yama_gandam"]),
+            "gulikai_kalam": jsonable_encoder(panchangam_data["gulikai_kalam"]),
+            "horas": jsonable_encoder(panchangam_data["horas"]),
+            "gowri_panchangam": jsonable_encoder(panchangam_data["gowri_panchangam"]),
+        }
+    
+    async def _store_panchangam_to_db(self, rows: List[Dict[str, Any]]):
+        """Store panchangam rows to database, skipping days already stored."""
+        if not rows:
+            return
+        
         try:
             db = SessionLocal()
             try:
-                # Check if already exists
-                existing = db.query(PanchangDay).filter(
-                    PanchangDay.date == date.fromisoformat(panchangam_data["date"]),
-                    PanchangDay.latitude == city.latitude,
-                    PanchangDay.longitude == city.longitude
-                ).first()
+                # Single INSERT ... ON CONFLICT DO NOTHING against the
+                # uq_panchang_day_key natural key instead of SELECT-then-INSERT per row
+                if db.bind.dialect.name == "postgresql":
+                    from sqlalchemy.dialects.postgresql import insert
+                else:
+                    from sqlalchemy.dialects.sqlite import insert
                 
-                if not existing:
-                    # Create PanchangDay object
-                    panchang_day = PanchangDay(
-                        date=date.fromisoformat(panchangam_data["date"]),
-                        latitude=city.latitude,
-                        longitude=city.longitude,
-                        timezone=city.timezone,
-                        sunrise=datetime.fromisoformat(panchangam_data["sunrise"]),
-                        sunset=datetime.fromisoformat(panchangam_data["sunset"]),
-                        tithi_number=panchangam_data["tithi"]["number"],
-                        tithi_name=panchangam_data["tithi"]["name"],
-                        tithi_progress=panchangam_data["tithi"]["progress"],
-                        nakshatra_number=panchangam_data["nakshatra"]["number"],
-                        nakshatra_name=panchangam_data["nakshatra"]["name"],
-                        nakshatra_progress=panchangam_data["nakshatra"]["progress"],
-                        yoga_number=panchangam_data["yoga"]["number"],
-                        yoga_name=panchangam_data["yoga"]["name"],
-                        yoga_progress=panchangam_data["yoga"]["progress"],
-                        karana_name=panchangam_data["karana"]["name"],
-                        karana_progress=panchangam_data["karana"]["progress"],
-                        rahu_kalam=panchangam_data["rahu_kalam"],
-                        yama_gandam=panchangam_data["yama_gandam"],
-                        gulikai_kalam=panchangam_data["gulikai_kalam"],
-                        horas=panchangam_data["horas"],
-                        gowri_panchangam=panchangam_data["gowri_panchangam"]
-                    )
-                    
-                    db.add(panchang_day)
-                    db.commit()
+                stmt = insert(PanchangDay).values(rows).on_conflict_do_nothing(
+                    index_elements=["date", "latitude", "longitude", "timezone"]
+                )
+                db.execute(stmt)
+                db.commit()
                     
             finally:
                 db.close()
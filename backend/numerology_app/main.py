@@ -2,11 +2,13 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .db import engine, Base, check_database_connection
 from .migrations.initial_schema import create_initial_schema
 from .jobs import initialize_jobs, cleanup_jobs
 from .config import settings
+from .health_interceptor import HealthCheckInterceptor
 
 # Import routers
 from .api_chat import router as chat_router
@@ -25,11 +27,13 @@ from .api_events import router as events_router
 from .api_interpretation import router as interpretation_router
 
 
-app = FastAPI(title="Astrooverz API")
+fastapi_app = FastAPI(title="Astrooverz API", default_response_class=ORJSONResponse)
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
+# /healthz and /api/healthz are answered by the interceptor, ahead of routing.
+# CORS wraps both so browser health checks get the same headers and preflight
+# handling as every other route.
+app = CORSMiddleware(
+    HealthCheckInterceptor(fastapi_app),
     allow_origins=settings.BACKEND_CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -37,7 +41,7 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
+@fastapi_app.on_event("startup")
 async def on_startup() -> None:
     """Initialize database and create tables on startup."""
     try:
@@ -59,7 +63,7 @@ async def on_startup() -> None:
         # Don't raise here to allow the app to start even if some services are unavailable
 
 
-@app.on_event("shutdown")
+@fastapi_app.on_event("shutdown")
 async def on_shutdown() -> None:
     """Cleanup resources on shutdown."""
     try:
@@ -88,17 +92,9 @@ for router in (
     events_router,
     interpretation_router,
 ):
-    app.include_router(router, prefix="/api")
+    fastapi_app.include_router(router, prefix="/api")
 
 
-@app.get("/healthz")
-def healthz() -> dict[str, bool]:
-    return {"ok": True}
-
-@app.get("/api/healthz")
-def api_healthz() -> dict[str, str | bool]:
-    return {"ok": True, "status": "healthy", "service": "numerology-api"}
-
 # Quick reading endpoint (temporary direct implementation)
 from pydantic import BaseModel
 from datetime import datetime
@@ -118,7 +114,7 @@ class QuickReadingResponse(BaseModel):
     auspicious_times: list
     message: str
 
-@app.post("/api/quick-reading", response_model=QuickReadingResponse)
+@fastapi_app.post("/api/quick-reading", response_model=QuickReadingResponse)
 async def quick_reading(request: QuickReadingRequest):
     """Generate a quick Vedic astrology reading based on birth details."""
     try:
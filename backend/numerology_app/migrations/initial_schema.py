@@ -43,6 +43,14 @@ def _create_additional_indexes():
         with engine.connect() as connection:
             # Additional indexes for panchang_days table
             additional_indexes = [
+                # Natural key for upserts (tables created before uq_panchang_day_key existed)
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_panchang_day_key ON panchang_days (date, latitude, longitude, timezone)",
+                
+                # Per-element indexes superseded by idx_panchang_elements
+                "DROP INDEX IF EXISTS idx_panchang_tithi",
+                "DROP INDEX IF EXISTS idx_panchang_nakshatra",
+                "DROP INDEX IF EXISTS idx_panchang_yoga",
+                
                 # Composite index for date range queries
                 "CREATE INDEX IF NOT EXISTS idx_panchang_date_range ON panchang_days (date DESC)",
                 
@@ -61,6 +69,15 @@ def _create_additional_indexes():
                 "CREATE INDEX IF NOT EXISTS idx_muhurtham_event_subtype ON muhurtham_periods (event_type, event_subtype)",
             ]
             
+            # BRIN indexes for cheap created_at time-window filtering on the
+            # append-mostly batch tables (PostgreSQL only)
+            if engine.dialect.name == "postgresql":
+                additional_indexes += [
+                    "CREATE INDEX IF NOT EXISTS idx_panchang_created_brin ON panchang_days USING brin (created_at)",
+                    "CREATE INDEX IF NOT EXISTS idx_festival_created_brin ON festival_days USING brin (created_at)",
+                    "CREATE INDEX IF NOT EXISTS idx_muhurtham_created_brin ON muhurtham_periods USING brin (created_at)",
+                ]
+            
             for index_sql in additional_indexes:
                 try:
                     connection.execute(text(index_sql))
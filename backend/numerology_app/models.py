@@ -1,11 +1,17 @@
 ﻿# backend/numerology_app/models.py
 from __future__ import annotations
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, DateTime, Text, func, Date, Float, Boolean, JSON, ForeignKey, Index
-from datetime import date, datetime
+from sqlalchemy import String, Integer, DateTime, Text, func, Date, Float, Boolean, JSON, ForeignKey, Index, UniqueConstraint
+from datetime import date, datetime, timezone
 from typing import Optional, Dict, Any
 from .db import Base
 
+
+def _utcnow() -> datetime:
+    """Client-side timestamp for batch-written tables (no per-row server clock call)."""
+    return datetime.now(timezone.utc)
+
+
 class Item(Base):
     __tablename__ = "items"
 
@@ -189,15 +195,16 @@ class PanchangDay(Base):
     gowri_panchangam: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
     
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     
     # Indexes for efficient querying
     __table_args__ = (
-        Index('idx_panchang_date_location', 'date', 'latitude', 'longitude', 'timezone'),
-        Index('idx_panchang_tithi', 'tithi_number', 'date'),
-        Index('idx_panchang_nakshatra', 'nakshatra_number', 'date'),
-        Index('idx_panchang_yoga', 'yoga_number', 'date'),
+        # Natural key: one row per date and location. Also serves date/location
+        # lookups and lets ingest use INSERT ... ON CONFLICT DO NOTHING.
+        UniqueConstraint('date', 'latitude', 'longitude', 'timezone', name='uq_panchang_day_key'),
+        # One covering index for element lookups; they are almost always date-bounded
+        Index('idx_panchang_elements', 'date', 'tithi_number', 'nakshatra_number', 'yoga_number'),
     )
 
 
@@ -247,8 +254,8 @@ class FestivalDay(Base):
     panchang_day: Mapped[Optional[PanchangDay]] = relationship("PanchangDay", backref="festivals")
     
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     
     # Indexes for efficient querying
     __table_args__ = (
@@ -295,8 +302,8 @@ class MuhurthamPeriod(Base):
     panchang_day: Mapped[Optional[PanchangDay]] = relationship("PanchangDay", backref="muhurtham_periods")
     
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     
     # Indexes for efficient querying
     __table_args__ = (
@@ -4,76 +4,264 @@ Astronomy module for Panchangam calculations using Skyfield.
 This module provides astronomical calculations required for Vedic panchangam
 computations including sun and moon positions, sunrise/sunset times, and
 sidereal longitude calculations with Lahiri ayanamsa.
+
+Skyfield is imported on first use, so importing this module (or core.py
+for the pure-math kernels) doesn't pay its import cost.
 """
 
+from __future__ import annotations
+
+import functools
 import math
 import os
-from datetime import datetime, date, timezone
-from typing import Tuple, Optional
+from datetime import datetime, date, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 import zoneinfo
 
-from skyfield.api import load, wgs84, N, E
-from skyfield import almanac
-from skyfield.timelib import Time
-from skyfield.positionlib import Apparent
-from skyfield.constants import AU_KM
+import numpy as np
+
+if TYPE_CHECKING:
+    from skyfield.timelib import Time, Timescale
 
 # Ephemeris configuration
 EPH_PATH = os.getenv("EPHEMERIS_FILE", "de421.bsp")  # Let Skyfield handle the download
-ts = load.timescale()
+
+@functools.lru_cache(maxsize=1)
+def _get_ts() -> Timescale:
+    """Shared Skyfield timescale, created on first use."""
+    from skyfield.api import load
+    return load.timescale()
 
 def get_ephemeris():
     """Load ephemeris - let Skyfield handle download if needed"""
-    return load(EPH_PATH)
+    return _load_kernel(EPH_PATH)
+
+@functools.lru_cache(maxsize=4)
+def _load_kernel(path: str):
+    """Open an SPK kernel once per process; later calls reuse the loaded file."""
+    from skyfield.api import load
+    return load(path)
+
+@functools.lru_cache(maxsize=64)
+def _zi(tz_name: str) -> zoneinfo.ZoneInfo:
+    """Cached ZoneInfo lookup by IANA name."""
+    return zoneinfo.ZoneInfo(tz_name)
 
 def get_observer(lat: float, lon: float, elevation_m: float = 0.0):
     """
     Build a Skyfield geographic position using the modern API.
     lat, lon in decimal degrees; east/north positive.
+
+    Coordinates are rounded to 4 decimals (~11 m) so repeat queries for the
+    same place reuse one cached position instead of rebuilding it.
     """
+    return _observer(round(lat, 4), round(lon, 4), elevation_m)
+
+@functools.lru_cache(maxsize=256)
+def _observer(lat: float, lon: float, elevation_m: float):
+    from skyfield.api import wgs84
     return wgs84.latlon(latitude_degrees=lat, longitude_degrees=lon, elevation_m=elevation_m)
 
-def sunrise_sunset_local(date_yyyy_mm_dd: str, lat: float, lon: float, tz_name: str):
+# Sunrise equation constants (NOAA / Meeus low-precision solar model)
+_J2000 = date(2000, 1, 1)
+_SUN_ALTITUDE = math.radians(-0.833)  # refraction + solar semi-diameter
+_OBLIQUITY = math.radians(23.4397)
+
+def fast_sunrise_sunset(date_obj: date, lat: float, lon: float) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Closed-form sunrise/sunset (UTC, timezone-aware) for the given date.
+
+    Uses the sunrise equation with the low-precision solar model from Meeus:
+    mean anomaly → equation of centre → ecliptic longitude → declination →
+    hour angle. Good to about a minute at non-polar latitudes, with no
+    ephemeris file or root finding. Returns (None, None) when the sun does
+    not cross the horizon that day (polar day/night).
+    """
+    # Days since J2000.0, shifted to local mean solar noon
+    n = (date_obj - _J2000).days
+    j_star = n - lon / 360.0
+
+    m = math.radians((357.5291 + 0.98560028 * j_star) % 360.0)
+    c = 1.9148 * math.sin(m) + 0.0200 * math.sin(2 * m) + 0.0003 * math.sin(3 * m)
+    lam = math.radians((math.degrees(m) + c + 180.0 + 102.9372) % 360.0)
+
+    # Solar transit, in days since J2000.0 epoch (2000-01-01 12:00 UTC)
+    j_transit = j_star + 0.0053 * math.sin(m) - 0.0069 * math.sin(2 * lam)
+
+    sin_decl = math.sin(lam) * math.sin(_OBLIQUITY)
+    cos_decl = math.sqrt(1.0 - sin_decl * sin_decl)
+    phi = math.radians(lat)
+    cos_omega = (math.sin(_SUN_ALTITUDE) - math.sin(phi) * sin_decl) / (math.cos(phi) * cos_decl)
+    if not -1.0 <= cos_omega <= 1.0:
+        return None, None
+
+    half_day = math.degrees(math.acos(cos_omega)) / 360.0
+    epoch = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+    return (epoch + timedelta(days=j_transit - half_day),
+            epoch + timedelta(days=j_transit + half_day))
+
+def fast_sunrise_sunset_batch(dates, lat: float, lon: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized fast_sunrise_sunset over many dates for one location.
+
+    Args:
+        dates: Sequence of dates (or a datetime64[D] array)
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+
+    Returns:
+        (sunrise_utc, sunset_utc) as datetime64[us] arrays, NaT on days
+        without a sunrise/sunset.
+    """
+    n = (np.asarray(dates, dtype='datetime64[D]') - np.datetime64(_J2000, 'D')).astype(np.float64)
+    j_star = n - lon / 360.0
+
+    m = np.radians(np.mod(357.5291 + 0.98560028 * j_star, 360.0))
+    c = 1.9148 * np.sin(m) + 0.0200 * np.sin(2 * m) + 0.0003 * np.sin(3 * m)
+    lam = np.radians(np.mod(np.degrees(m) + c + 180.0 + 102.9372, 360.0))
+    j_transit = j_star + 0.0053 * np.sin(m) - 0.0069 * np.sin(2 * lam)
+
+    sin_decl = np.sin(lam) * math.sin(_OBLIQUITY)
+    cos_decl = np.sqrt(1.0 - sin_decl * sin_decl)
+    phi = math.radians(lat)
+    cos_omega = (math.sin(_SUN_ALTITUDE) - math.sin(phi) * sin_decl) / (math.cos(phi) * cos_decl)
+    polar = np.abs(cos_omega) > 1.0
+    half_day = np.degrees(np.arccos(np.clip(cos_omega, -1.0, 1.0))) / 360.0
+
+    epoch = np.datetime64('2000-01-01T12:00:00', 'us')
+    def to_datetime64(days):
+        t = epoch + np.round(days * 86_400_000_000).astype(np.int64).astype('timedelta64[us]')
+        return np.where(polar, np.datetime64('NaT'), t)
+
+    return to_datetime64(j_transit - half_day), to_datetime64(j_transit + half_day)
+
+def sunrise_sunset_local(date_yyyy_mm_dd: str, lat: float, lon: float, tz_name: str,
+                         high_precision: bool = False):
     """
     Returns (sunrise_local_iso, sunset_local_iso) strings.
-    Handles the civil-twilight refraction by using almanac.sunrise_sunset().
+
+    String form of sunrise_sunset_local_dt(); use that directly when the
+    caller needs datetimes.
     """
-    eph = get_ephemeris()
-    tz = zoneinfo.ZoneInfo(tz_name)
+    sunrise_local, sunset_local = sunrise_sunset_local_dt(date_yyyy_mm_dd, lat, lon, tz_name, high_precision)
+    return (sunrise_local.isoformat() if sunrise_local else None,
+            sunset_local.isoformat() if sunset_local else None)
 
-    # Build time window: local calendar day → UTC boundaries
-    day_start_local = datetime.fromisoformat(f"{date_yyyy_mm_dd}T00:00:00").replace(tzinfo=tz)
-    day_end_local   = day_start_local.replace(hour=23, minute=59, second=59)
+def sunrise_sunset_local_dt(date_yyyy_mm_dd: str, lat: float, lon: float, tz_name: str,
+                            high_precision: bool = False) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Returns (sunrise_local, sunset_local) as timezone-aware datetimes, or
+    None for an event that doesn't happen that day.
 
-    t0 = ts.from_datetime(day_start_local.astimezone(timezone.utc))
-    t1 = ts.from_datetime(day_end_local.astimezone(timezone.utc))
+    By default uses fast_sunrise_sunset(). With high_precision=True it runs
+    Skyfield's almanac.sunrise_sunset() search against the ephemeris instead.
+    """
+    tz = _zi(tz_name)
+
+    if not high_precision:
+        sunrise_utc, sunset_utc = fast_sunrise_sunset(date.fromisoformat(date_yyyy_mm_dd), lat, lon)
+    else:
+        from skyfield import almanac
+        eph = get_ephemeris()
+        t0, t1 = _local_day_window(date_yyyy_mm_dd, tz_name)
+
+        topos = get_observer(lat, lon)
+        f = almanac.sunrise_sunset(eph, topos)
+        times, events = almanac.find_discrete(t0, t1, f)
 
-    topos = get_observer(lat, lon)
-    f = almanac.sunrise_sunset(eph, topos)
-    times, events = almanac.find_discrete(t0, t1, f)
+        sunrise_utc = None
+        sunset_utc = None
+        for t, ev in zip(times, events):
+            if ev == 1 and sunrise_utc is None:
+                sunrise_utc = t.utc_datetime()
+            elif ev == 0 and sunset_utc is None:
+                sunset_utc = t.utc_datetime()
 
-    sunrise_utc = None
-    sunset_utc = None
-    for t, ev in zip(times, events):
-        if ev == 1 and sunrise_utc is None:
-            sunrise_utc = t.utc_datetime().replace(tzinfo=timezone.utc)
-        elif ev == 0 and sunset_utc is None:
-            sunset_utc = t.utc_datetime().replace(tzinfo=timezone.utc)
+    return (sunrise_utc.astimezone(tz) if sunrise_utc else None,
+            sunset_utc.astimezone(tz) if sunset_utc else None)
 
-    sunrise_local = sunrise_utc.astimezone(tz).isoformat() if sunrise_utc else None
-    sunset_local  = sunset_utc.astimezone(tz).isoformat() if sunset_utc else None
-    return sunrise_local, sunset_local
+@functools.lru_cache(maxsize=1024)
+def _local_day_window(date_yyyy_mm_dd: str, tz_name: str) -> Tuple[Time, Time]:
+    """Skyfield times bounding a local calendar day (00:00:00 → 23:59:59)."""
+    day_start_local = datetime.fromisoformat(f"{date_yyyy_mm_dd}T00:00:00").replace(tzinfo=_zi(tz_name))
+    day_end_local   = day_start_local.replace(hour=23, minute=59, second=59)
+    ts = _get_ts()
+    return (ts.from_datetime(day_start_local.astimezone(timezone.utc)),
+            ts.from_datetime(day_end_local.astimezone(timezone.utc)))
+
+def _ecliptic_longitude(eph, body: str, t: Time, apparent: bool = False):
+    """
+    Geocentric ecliptic longitude of a body in degrees (not normalized).
 
-def sun_moon_ecliptic_longitudes(dt: datetime, lat: float, lon: float):
+    The default geometric position is one vector evaluation. apparent=True
+    runs observe().apparent() (light-time iteration plus aberration), which
+    moves the sun by ~20" - far below a 12° tithi or 13°20' nakshatra.
+    """
+    earth = eph['earth']
+    if apparent:
+        position = earth.at(t).observe(eph[body]).apparent()
+    else:
+        position = (eph[body] - earth).at(t)
+    return position.ecliptic_latlon()[1].degrees
+
+def sun_moon_ecliptic_longitudes(dt: datetime, lat: float, lon: float, apparent: bool = False):
     """Get sun and moon ecliptic longitudes for tithi/nakshatra calculations"""
     eph = get_ephemeris()
-    t = ts.from_datetime(dt.astimezone(timezone.utc))
+    t = _get_ts().from_datetime(dt.astimezone(timezone.utc))
     # Use geocentric longitudes (observer not needed here)
-    e = eph['earth']
-    sun = e.at(t).observe(eph['sun']).apparent().ecliptic_latlon()[1].degrees % 360.0
-    moon = e.at(t).observe(eph['moon']).apparent().ecliptic_latlon()[1].degrees % 360.0
+    sun = float(_ecliptic_longitude(eph, 'sun', t, apparent) % 360.0)
+    moon = float(_ecliptic_longitude(eph, 'moon', t, apparent) % 360.0)
     return sun, moon
 
+def sun_moon_ecliptic_longitudes_batch(dts: List[datetime], apparent: bool = False):
+    """
+    Batched sun_moon_ecliptic_longitudes: one Skyfield Time array and one
+    position evaluation per body for all datetimes. Returns (sun, moon) ndarrays.
+    """
+    eph = get_ephemeris()
+    t = _get_ts().from_datetimes([dt.astimezone(timezone.utc) for dt in dts])
+    sun = _ecliptic_longitude(eph, 'sun', t, apparent) % 360.0
+    moon = _ecliptic_longitude(eph, 'moon', t, apparent) % 360.0
+    return sun, moon
+
+
+# Sun/moon longitude table around today for day-level (local noon) queries.
+# 6-hour steps keep linear interpolation of the moon within ~0.005°.
+_TABLE_STEP_HOURS = 6
+_TABLE_SPAN_DAYS = 365
+
+@functools.lru_cache(maxsize=2)
+def _longitude_table(centre: date, apparent: bool):
+    """(start_utc, sun, moon): unwrapped geocentric longitudes every 6 h over centre ± 1 year."""
+    start = datetime(centre.year, centre.month, centre.day, tzinfo=timezone.utc) - timedelta(days=_TABLE_SPAN_DAYS)
+    steps = 2 * _TABLE_SPAN_DAYS * 24 // _TABLE_STEP_HOURS + 1
+    t = _get_ts().utc(start.year, start.month, start.day, np.arange(steps) * _TABLE_STEP_HOURS)
+    eph = get_ephemeris()
+    sun = np.unwrap(_ecliptic_longitude(eph, 'sun', t, apparent), period=360.0)
+    moon = np.unwrap(_ecliptic_longitude(eph, 'moon', t, apparent), period=360.0)
+    return start, sun, moon
+
+def refresh_longitude_table(apparent: bool = False) -> None:
+    """Build today's longitude table ahead of the first request (rolls over daily)."""
+    _longitude_table(datetime.now(timezone.utc).date(), apparent)
+
+def tabulated_sun_moon_longitudes(dt: datetime, apparent: bool = False):
+    """
+    sun_moon_ecliptic_longitudes() served from the ±1 year table.
+
+    Interpolates linearly between 6-hourly samples instead of evaluating the
+    ephemeris; times outside the table fall back to the direct computation.
+    """
+    start, sun, moon = _longitude_table(datetime.now(timezone.utc).date(), apparent)
+    x = (dt - start).total_seconds() / (_TABLE_STEP_HOURS * 3600.0)
+    if not 0.0 <= x < len(sun) - 1:
+        return sun_moon_ecliptic_longitudes(dt, 0.0, 0.0, apparent)
+
+    i = int(x)
+    frac = x - i
+    return (float((sun[i] + frac * (sun[i + 1] - sun[i])) % 360.0),
+            float((moon[i] + frac * (moon[i + 1] - moon[i])) % 360.0))
+
 
 class AstronomyEngine:
     """
@@ -82,96 +270,91 @@ class AstronomyEngine:
     Uses DE440s ephemeris for accuracy and caches timescale for performance.
     """
     
+    # DE440s ephemeris (smaller than DE441 but still accurate)
+    EPH_FILE = 'de440s.bsp'
+    
     def __init__(self):
         """Initialize the astronomy engine with Skyfield data."""
-        # Load DE440s ephemeris (smaller than DE441 but still accurate)
-        self.eph = load('de440s.bsp')
-        self.timescale = load.timescale()
-        
+        # The timescale and ephemeris are both loaded on first use
         # Cache for timescale to avoid reloading
         self._ts_cache = {}
     
-    def get_timescale(self) -> Time:
+    @property
+    def eph(self):
+        """Ephemeris, loaded lazily so importing this module doesn't parse the kernel."""
+        return _load_kernel(self.EPH_FILE)
+    
+    @property
+    def timescale(self) -> Timescale:
+        """Shared module timescale."""
+        return _get_ts()
+    
+    def get_timescale(self) -> Timescale:
         """Get cached timescale for performance."""
-        return self.timescale
+        return _get_ts()
     
-    def sun_longitude_ecliptic(self, dt: datetime) -> float:
+    def sun_longitude_ecliptic(self, dt: datetime, apparent: bool = False) -> float:
         """
         Calculate sun's longitude in ecliptic coordinates (sidereal with Lahiri ayanamsa).
         
         Args:
             dt: Date and time for calculation
+            apparent: Use the apparent instead of the geometric position
             
         Returns:
             Sun's longitude in degrees (0-360)
             
         Formula:
-            - Get apparent position of sun from Skyfield
+            - Get geometric (or apparent) position of sun from Skyfield
             - Convert to ecliptic coordinates
             - Apply Lahiri ayanamsa correction (50.2388475° for 2000.0 epoch)
         """
         ts = self.get_timescale()
         t = ts.from_datetime(dt)
         
-        # Get sun position
-        sun = self.eph['sun']
-        earth = self.eph['earth']
-        
-        # Calculate apparent position
-        astrometric = earth.at(t).observe(sun)
-        apparent = astrometric.apparent()
-        
-        # Get ecliptic coordinates
-        lat, lon, distance = apparent.ecliptic_latlon()
+        # Get ecliptic longitude in degrees
+        sun_longitude = _ecliptic_longitude(self.eph, 'sun', t, apparent)
         
-        # Convert to degrees and apply Lahiri ayanamsa
-        sun_longitude = lon.degrees
+        # Lahiri ayanamsa
         lahiri_ayanamsa = 50.2388475  # Degrees for 2000.0 epoch
         
         # Apply ayanamsa correction for sidereal longitude
-        sidereal_longitude = (sun_longitude - lahiri_ayanamsa) % 360
+        sidereal_longitude = float((sun_longitude - lahiri_ayanamsa) % 360)
         
         return sidereal_longitude
     
-    def moon_longitude_ecliptic(self, dt: datetime) -> float:
+    def moon_longitude_ecliptic(self, dt: datetime, apparent: bool = False) -> float:
         """
         Calculate moon's longitude in ecliptic coordinates (sidereal with Lahiri ayanamsa).
         
         Args:
             dt: Date and time for calculation
+            apparent: Use the apparent instead of the geometric position
             
         Returns:
             Moon's longitude in degrees (0-360)
             
         Formula:
-            - Get apparent position of moon from Skyfield
+            - Get geometric (or apparent) position of moon from Skyfield
             - Convert to ecliptic coordinates
             - Apply Lahiri ayanamsa correction
         """
         ts = self.get_timescale()
         t = ts.from_datetime(dt)
         
-        # Get moon position
-        moon = self.eph['moon']
-        earth = self.eph['earth']
+        # Get ecliptic longitude in degrees
+        moon_longitude = _ecliptic_longitude(self.eph, 'moon', t, apparent)
         
-        # Calculate apparent position
-        astrometric = earth.at(t).observe(moon)
-        apparent = astrometric.apparent()
-        
-        # Get ecliptic coordinates
-        lat, lon, distance = apparent.ecliptic_latlon()
-        
-        # Convert to degrees and apply Lahiri ayanamsa
-        moon_longitude = lon.degrees
+        # Lahiri ayanamsa
         lahiri_ayanamsa = 50.2388475  # Degrees for 2000.0 epoch
         
         # Apply ayanamsa correction for sidereal longitude
-        sidereal_longitude = (moon_longitude - lahiri_ayanamsa) % 360
+        sidereal_longitude = float((moon_longitude - lahiri_ayanamsa) % 360)
         
         return sidereal_longitude
     
-    def sunrise_sunset(self, date_obj: date, lat: float, lon: float, tz: str) -> Tuple[datetime, datetime]:
+    def sunrise_sunset(self, date_obj: date, lat: float, lon: float, tz: str,
+                       high_precision: bool = False) -> Tuple[datetime, datetime]:
         """
         Calculate sunrise and sunset times for a given date and location.
         
@@ -180,33 +363,75 @@ class AstronomyEngine:
             lat: Latitude in degrees
             lon: Longitude in degrees  
             tz: Timezone string (e.g., 'Asia/Kolkata')
+            high_precision: Use the Skyfield almanac search instead of the
+                closed-form approximation
             
         Returns:
             Tuple of (sunrise_time, sunset_time) as datetime objects
         """
         # Use the new modern helper function
-        sunrise_iso, sunset_iso = sunrise_sunset_local(date_obj.isoformat(), lat, lon, tz)
+        sunrise_dt, sunset_dt = sunrise_sunset_local_dt(date_obj.isoformat(), lat, lon, tz, high_precision)
         
-        if sunrise_iso and sunset_iso:
-            # Convert ISO strings back to datetime objects
-            sunrise_dt = datetime.fromisoformat(sunrise_iso.replace('Z', '+00:00'))
-            sunset_dt = datetime.fromisoformat(sunset_iso.replace('Z', '+00:00'))
+        if sunrise_dt and sunset_dt:
             return sunrise_dt, sunset_dt
         else:
             # Fallback to approximate times if calculation fails
-            tz_obj = zoneinfo.ZoneInfo(tz)
+            tz_obj = _zi(tz)
             base_date = datetime.combine(date_obj, datetime.min.time()).replace(tzinfo=tz_obj)
             return base_date.replace(hour=6), base_date.replace(hour=18)
-    
+
+    def year_sun_events(self, year: int, lat: float, lon: float, tz: str) -> List[Tuple[datetime, datetime]]:
+        """
+        Calculate sunrise and sunset times for every day of a year in one search.
+
+        Args:
+            year: Calendar year (local to ``tz``)
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            tz: Timezone string (e.g., 'Asia/Kolkata')
+
+        Returns:
+            List of (sunrise_time, sunset_time) tuples in date order, as
+            timezone-aware local datetimes. Days without both a sunrise and a
+            sunset (polar day/night) are omitted.
+
+        A single almanac.find_discrete() call over the whole year replaces
+        365 per-day searches, which is what bulk precompute jobs need.
+        """
+        tz_obj = _zi(tz)
+        ts = self.get_timescale()
+
+        # Local calendar year → UTC boundaries
+        year_start = datetime(year, 1, 1, tzinfo=tz_obj)
+        year_end = datetime(year + 1, 1, 1, tzinfo=tz_obj)
+        t0 = ts.from_datetime(year_start.astimezone(timezone.utc))
+        t1 = ts.from_datetime(year_end.astimezone(timezone.utc))
+
+        from skyfield import almanac
+        f = almanac.sunrise_sunset(self.eph, get_observer(lat, lon))
+        times, events = almanac.find_discrete(t0, t1, f)
+
+        # Pair events by local date, converting each event only once
+        by_date: Dict[date, Dict[int, datetime]] = {}
+        for utc_dt, ev in zip(times.utc_datetime(), events):
+            local_dt = utc_dt.astimezone(tz_obj)
+            by_date.setdefault(local_dt.date(), {}).setdefault(int(ev), local_dt)
+
+        return [
+            (day_events[1], day_events[0])
+            for _, day_events in sorted(by_date.items())
+            if 1 in day_events and 0 in day_events
+        ]
+
     def _find_sun_event(self, base_time: datetime, location, 
-                       sun, earth, ts: Time, target_altitude: float, 
+                       sun, earth, ts: Timescale, target_altitude: float, 
                        is_sunrise: bool) -> datetime:
         """
-        Find sun event (sunrise/sunset) using iterative altitude solving.
+        Find sun event (sunrise/sunset) with Newton's method on altitude.
         
         Args:
-            base_time: Base time for search
-            location: Geographic location
+            base_time: Base time for search (timezone-aware)
+            location: Geographic location (wgs84 position)
             sun: Sun object from ephemeris
             earth: Earth object from ephemeris
             ts: Timescale
@@ -215,57 +440,73 @@ class AstronomyEngine:
             
         Returns:
             UTC datetime of the event
+            
+        Formula:
+            - Start from 06:00 (sunrise) or 18:00 (sunset) local
+            - dh/dt ≈ 15°/hour × cos(lat) × sin(azimuth)
+            - t += (target - h) / (dh/dt), until the step is under 0.1 s
         """
         # Start with approximate time
-        if is_sunrise:
-            search_time = base_time.replace(hour=6, minute=0, second=0)
-        else:
-            search_time = base_time.replace(hour=18, minute=0, second=0)
+        hour = 6 if is_sunrise else 18
+        start = base_time.replace(hour=hour, minute=0, second=0, microsecond=0)
+        t_jd = ts.from_datetime(start).tt
         
-        # Iterative search for exact time
-        for iteration in range(10):  # Max 10 iterations
-            t = ts.from_datetime(search_time)
-            
-            # Calculate sun position
-            astrometric = earth.at(t).observe(sun)
-            apparent = astrometric.apparent()
+        observer = earth + location
+        cos_lat = math.cos(location.latitude.radians)
+        
+        for iteration in range(8):
+            alt, az, _ = observer.at(ts.tt_jd(t_jd)).observe(sun).apparent().altaz()
             
-            # Calculate altitude at location
-            alt, az, distance = apparent.altaz(location)
-            current_altitude = alt.degrees
+            # Altitude rate in degrees per second (Earth turns 15°/hour)
+            rate = (15.0 / 3600.0) * cos_lat * math.sin(az.radians)
+            if abs(rate) < 1e-9:
+                break  # Sun at meridian or pole: no horizon crossing to chase
             
-            # Check if we're close enough
-            if abs(current_altitude - target_altitude) < 0.01:
+            step_seconds = (target_altitude - alt.degrees) / rate
+            t_jd += step_seconds / 86400.0
+            if abs(step_seconds) < 0.1:
                 break
-            
-            # Adjust time based on altitude difference
-            time_adjustment = (current_altitude - target_altitude) * 4  # Rough conversion
-            search_time = search_time.replace(
-                hour=search_time.hour,
-                minute=max(0, min(59, search_time.minute + int(time_adjustment))),
-                second=0
-            )
         
-        return search_time
+        return ts.tt_jd(t_jd).utc_datetime()
 
 
 # Global instance for use across the application
 astronomy_engine = AstronomyEngine()
 
 
-def get_sun_longitude(dt: datetime) -> float:
+def get_sun_longitude(dt: datetime, apparent: bool = False) -> float:
     """Convenience function to get sun's sidereal longitude."""
-    return astronomy_engine.sun_longitude_ecliptic(dt)
+    return astronomy_engine.sun_longitude_ecliptic(dt, apparent)
 
 
-def get_moon_longitude(dt: datetime) -> float:
+def get_moon_longitude(dt: datetime, apparent: bool = False) -> float:
     """Convenience function to get moon's sidereal longitude."""
-    return astronomy_engine.moon_longitude_ecliptic(dt)
+    return astronomy_engine.moon_longitude_ecliptic(dt, apparent)
+
+
+def get_sunrise_sunset(date_obj: date, lat: float, lon: float, tz: str,
+                       high_precision: bool = False) -> Tuple[datetime, datetime]:
+    """
+    Convenience function to get sunrise and sunset times.
+
+    Results are memoised per (date, lat, lon, tz, high_precision); the tuple
+    of aware datetimes is immutable, so callers can't alter cached entries.
+    """
+    return _sunrise_sunset_cached(date_obj.isoformat(), lat, lon, tz, high_precision)
+
+
+@functools.lru_cache(maxsize=4096)
+def _sunrise_sunset_cached(date_yyyy_mm_dd: str, lat: float, lon: float, tz: str,
+                           high_precision: bool) -> Tuple[datetime, datetime]:
+    return astronomy_engine.sunrise_sunset(date.fromisoformat(date_yyyy_mm_dd), lat, lon, tz, high_precision)
+
+
+get_sunrise_sunset.cache_clear = _sunrise_sunset_cached.cache_clear
 
 
-def get_sunrise_sunset(date_obj: date, lat: float, lon: float, tz: str) -> Tuple[datetime, datetime]:
-    """Convenience function to get sunrise and sunset times."""
-    return astronomy_engine.sunrise_sunset(date_obj, lat, lon, tz)
+def get_year_sun_events(year: int, lat: float, lon: float, tz: str) -> List[Tuple[datetime, datetime]]:
+    """Convenience function to get a full year of sunrise and sunset times."""
+    return astronomy_engine.year_sun_events(year, lat, lon, tz)
 
 
 # TODO: Add unit tests for:
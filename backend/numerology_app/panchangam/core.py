@@ -5,13 +5,16 @@ This module contains the main algorithms for calculating Vedic panchangam elemen
 including tithi, nakshatra, yoga, karana, and other astrological timings.
 """
 
+import functools
 import math
 import logging
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Tuple, Optional, Any
-import pytz
+import numpy as np
 
-from .astronomy import get_sun_longitude, get_moon_longitude, get_sunrise_sunset, sunrise_sunset_local, sun_moon_ecliptic_longitudes
+from ..jit import has_numba, lazy_njit, prange
+
+from .astronomy import _zi, get_sun_longitude, get_moon_longitude, get_sunrise_sunset, sunrise_sunset_local_dt, sun_moon_ecliptic_longitudes, tabulated_sun_moon_longitudes
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +22,11 @@ logger = logging.getLogger(__name__)
 # Constants for panchangam calculations
 LAHIRI_AYANAMSA = 50.2388475  # Degrees for 2000.0 epoch
 TITHI_DURATION = 12.0  # Degrees (360/30 tithis)
-NAKSHATRA_DURATION = 13.333333  # Degrees (360/27 nakshatras)
+NAKSHATRA_DURATION = 360.0 / 27  # Degrees (13°20', 360/27 nakshatras)
+# Reciprocals, so the kernels multiply instead of divide
+_INV_TITHI = 1.0 / TITHI_DURATION
+_INV_NAKSHATRA = 27 / 360.0
+
 YOGAS = [
     "Vishkambha", "Preeti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda",
     "Sukarma", "Dhriti", "Shoola", "Ganda", "Vriddhi", "Dhruva",
@@ -41,6 +48,15 @@ KARANAS = [
     "Shakuni", "Chatushpada", "Naga", "Kimstughna"
 ]
 
+# Tithi labels indexed by tithi number 1-30 (index 0 unused)
+TITHI_NAMES = [None] + [f"Shukla {i}" for i in range(1, 16)] + [f"Krishna {i}" for i in range(1, 16)]
+
+# Object-array copies of the name lists for batched lookups
+TITHI_NAMES_ARR = np.array(TITHI_NAMES, dtype=object)
+NAKSHATRAS_ARR = np.array(NAKSHATRAS, dtype=object)
+YOGAS_ARR = np.array(YOGAS, dtype=object)
+KARANAS_ARR = np.array(KARANAS, dtype=object)
+
 
 def compute_tithi(sun_long: float, moon_long: float) -> Tuple[int, float]:
     """
@@ -65,7 +81,7 @@ def compute_tithi(sun_long: float, moon_long: float) -> Tuple[int, float]:
     tithi_diff = (moon_long - sun_long) % 360
     
     # Convert to tithi number (0-29)
-    tithi_raw = tithi_diff / TITHI_DURATION
+    tithi_raw = tithi_diff * _INV_TITHI
     
     # Get tithi number (1-30)
     tithi_number = int(tithi_raw) + 1
@@ -89,12 +105,12 @@ def compute_nakshatra(moon_long: float) -> Tuple[int, float]:
         - nakshatra_progress: 0.0-1.0 (progress within the nakshatra)
         
     Formula:
-        nakshatra = moon_long / 13.333333
+        nakshatra = moon_long / (360/27)
         nakshatra_number = floor(nakshatra) + 1
         nakshatra_progress = nakshatra - floor(nakshatra)
     """
     # Calculate nakshatra number (0-26)
-    nakshatra_raw = moon_long / NAKSHATRA_DURATION
+    nakshatra_raw = moon_long * _INV_NAKSHATRA
     
     # Get nakshatra number (1-27)
     nakshatra_number = int(nakshatra_raw) + 1
@@ -120,7 +136,7 @@ def compute_yoga(sun_long: float, moon_long: float) -> Tuple[int, float]:
         
     Formula:
         yoga_sum = (sun_long + moon_long) % 360
-        yoga = yoga_sum / 13.333333
+        yoga = yoga_sum / (360/27)
         yoga_number = floor(yoga) + 1
         yoga_progress = yoga - floor(yoga)
     """
@@ -128,7 +144,7 @@ def compute_yoga(sun_long: float, moon_long: float) -> Tuple[int, float]:
     yoga_sum = (sun_long + moon_long) % 360
     
     # Calculate yoga number (0-26)
-    yoga_raw = yoga_sum / NAKSHATRA_DURATION  # Same duration as nakshatra
+    yoga_raw = yoga_sum * _INV_NAKSHATRA  # Same duration as nakshatra
     
     # Get yoga number (1-27)
     yoga_number = int(yoga_raw) + 1
@@ -158,30 +174,217 @@ def compute_karana(tithi_number: int, tithi_progress: float) -> Tuple[str, float
         - 8th karana (Vishti) occurs only once per tithi
         - Karanas 9-11 occur only on specific tithis
     """
-    # Calculate karana index (0-10)
-    karana_index = int(tithi_progress * 2)  # 2 karanas per tithi
-    
-    # Handle special karanas
-    if tithi_number in [1, 6, 11, 16, 21, 26]:  # Specific tithis for karanas 9-11
-        if karana_index == 0:
-            karana_name = KARANAS[8]  # Chatushpada
-        else:
-            karana_name = KARANAS[9]  # Naga
-    elif tithi_number in [2, 7, 12, 17, 22, 27]:
-        if karana_index == 0:
-            karana_name = KARANAS[9]  # Naga
-        else:
-            karana_name = KARANAS[10]  # Kimstughna
-    else:
-        # Regular karanas (0-6 cycle)
-        karana_name = KARANAS[karana_index % 7]
+    # Which half of the tithi (2 karanas per tithi)
+    half = int(tithi_progress * 2)
+    
+    karana_name = KARANAS[_KARANA_TABLE[(tithi_number - 1) * 2 + half]]
     
     # Calculate progress within karana
-    karana_progress = (tithi_progress * 2) - karana_index
+    karana_progress = (tithi_progress * 2) - half
     
     return karana_name, karana_progress
 
 
+def _karana_rule(tithi_number: int, half: int) -> int:
+    """KARANAS index for one half (0 or 1) of a tithi."""
+    if tithi_number in (1, 6, 11, 16, 21, 26):  # Specific tithis for karanas 9-11
+        return 8 if half == 0 else 9  # Chatushpada, Naga
+    if tithi_number in (2, 7, 12, 17, 22, 27):
+        return 9 if half == 0 else 10  # Naga, Kimstughna
+    # Regular karanas (0-6 cycle)
+    return half % 7
+
+
+# Karana index (into KARANAS) for each half of each tithi: entry
+# (tithi_number - 1) * 2 + half, where half is 0 or 1. Shared by the
+# scalar and vectorized karana functions.
+_KARANA_TABLE = np.array(
+    [_karana_rule(t, half) for t in range(1, 31) for half in (0, 1)],
+    dtype=np.int8,
+)
+
+
+def compute_tithi_vec(sun_long: np.ndarray, moon_long: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized compute_tithi over arrays of longitudes.
+    
+    Returns:
+        Tuple of (tithi_numbers, tithi_progress) arrays
+    """
+    tithi_raw = np.mod(np.asarray(moon_long) - np.asarray(sun_long), 360.0) * _INV_TITHI
+    whole = np.floor(tithi_raw)
+    return whole.astype(np.int32) + 1, tithi_raw - whole
+
+
+def compute_nakshatra_vec(moon_long: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized compute_nakshatra over an array of moon longitudes.
+    
+    Returns:
+        Tuple of (nakshatra_numbers, nakshatra_progress) arrays
+    """
+    nakshatra_raw = np.asarray(moon_long) * _INV_NAKSHATRA
+    whole = np.floor(nakshatra_raw)
+    return whole.astype(np.int32) + 1, nakshatra_raw - whole
+
+
+def compute_yoga_vec(sun_long: np.ndarray, moon_long: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized compute_yoga over arrays of longitudes.
+    
+    Returns:
+        Tuple of (yoga_numbers, yoga_progress) arrays
+    """
+    yoga_raw = np.mod(np.asarray(sun_long) + np.asarray(moon_long), 360.0) * _INV_NAKSHATRA
+    whole = np.floor(yoga_raw)
+    return whole.astype(np.int32) + 1, yoga_raw - whole
+
+
+def compute_karana_vec(tithi_number: np.ndarray, tithi_progress: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized compute_karana over arrays of tithi values.
+    
+    Returns:
+        Tuple of (karana_indices, karana_progress) arrays; the indices
+        point into KARANAS.
+    """
+    doubled = np.asarray(tithi_progress) * 2
+    half = doubled.astype(np.int32)
+    karana_index = np.take(_KARANA_TABLE, (np.asarray(tithi_number) - 1) * 2 + half)
+    return karana_index, doubled - half
+
+
+@lazy_njit(cache=True, parallel=True)
+def _elements_kernel(sun_long, moon_long, karana_table):
+    """
+    Fused tithi/nakshatra/yoga/karana loop over float64 longitude arrays.
+    
+    Plain loops and math.floor only, so it compiles under numba.njit; the
+    numbers and progress match the scalar compute_* functions.
+    """
+    n = sun_long.shape[0]
+    numbers = np.empty((4, n), dtype=np.int32)
+    progress = np.empty((4, n), dtype=np.float64)
+    for i in prange(n):
+        tithi_raw = ((moon_long[i] - sun_long[i]) % 360.0) * _INV_TITHI
+        tithi_whole = math.floor(tithi_raw)
+        nakshatra_raw = moon_long[i] * _INV_NAKSHATRA
+        nakshatra_whole = math.floor(nakshatra_raw)
+        yoga_raw = ((sun_long[i] + moon_long[i]) % 360.0) * _INV_NAKSHATRA
+        yoga_whole = math.floor(yoga_raw)
+        doubled = (tithi_raw - tithi_whole) * 2.0
+        half = math.floor(doubled)
+
+        numbers[0, i] = tithi_whole + 1
+        numbers[1, i] = nakshatra_whole + 1
+        numbers[2, i] = yoga_whole + 1
+        numbers[3, i] = karana_table[tithi_whole * 2 + half]
+        progress[0, i] = tithi_raw - tithi_whole
+        progress[1, i] = nakshatra_raw - nakshatra_whole
+        progress[2, i] = yoga_raw - yoga_whole
+        progress[3, i] = doubled - half
+    return numbers, progress
+
+
+def compute_elements_vec(sun_long: np.ndarray, moon_long: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute tithi, nakshatra, yoga and karana for arrays of longitudes.
+    
+    Returns:
+        Tuple of (numbers, progress), each shaped (4, N) with rows
+        tithi, nakshatra, yoga, karana. Karana numbers are indices into
+        KARANAS.
+    
+    Uses the numba-compiled fused kernel when numba is installed and the
+    NumPy compute_*_vec functions otherwise.
+    """
+    sun_long = np.ascontiguousarray(sun_long, dtype=np.float64)
+    moon_long = np.ascontiguousarray(moon_long, dtype=np.float64)
+    if has_numba():
+        return _elements_kernel(sun_long, moon_long, _KARANA_TABLE)
+
+    numbers, progress = _panchangam_core(sun_long, moon_long)
+    karana_idx, karana_prog = compute_karana_vec(numbers[0], progress[0])
+    return (np.vstack([numbers, karana_idx.astype(np.int32)]),
+            np.vstack([progress, karana_prog]))
+
+
+def element_names_vec(numbers: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Names for a batch of elements from compute_elements_vec().
+    
+    Args:
+        numbers: (4, N) array with rows tithi, nakshatra, yoga, karana
+        
+    Returns:
+        Tuple of (tithi_names, nakshatra_names, yoga_names, karana_names)
+        object arrays
+    """
+    return (TITHI_NAMES_ARR[numbers[0]],
+            NAKSHATRAS_ARR[numbers[1] - 1],
+            YOGAS_ARR[numbers[2] - 1],
+            KARANAS_ARR[numbers[3]])
+
+
+# Reciprocal bucket widths for the packed (tithi, nakshatra, yoga) rows
+_ELEMENT_SCALE = np.array([[_INV_TITHI], [_INV_NAKSHATRA], [_INV_NAKSHATRA]])
+
+
+def _panchangam_core(sun_long: np.ndarray, moon_long: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tithi, nakshatra and yoga for arrays of longitudes in one packed pass.
+    
+    The three angles (moon - sun, moon, sun + moon) share a (3, N) array so
+    the modulo, scaling and floor each run once over contiguous memory.
+    
+    Returns:
+        Tuple of (numbers, progress), each shaped (3, N) with rows
+        tithi, nakshatra, yoga
+    """
+    packed = np.empty((3, sun_long.shape[0]), dtype=np.float64)
+    np.subtract(moon_long, sun_long, out=packed[0])
+    packed[1] = moon_long
+    np.add(sun_long, moon_long, out=packed[2])
+    np.mod(packed, 360.0, out=packed)
+    packed *= _ELEMENT_SCALE
+    whole = np.floor(packed)
+    return whole.astype(np.int32) + 1, packed - whole
+
+
+# Rahu Kalam, Yama Gandam and Gulikai Kalam as (start, end) hours after
+# sunrise, one row per weekday (0=Monday, 6=Sunday). Columns are rahu start,
+# rahu end, yama start, yama end, gulikai start, gulikai end.
+_RYG_PERIODS = np.array([
+    #  rahu         yama         gulikai
+    [8.0, 9.5,   3.0, 4.5,   12.0, 13.5],  # Monday
+    [3.0, 4.5,   12.0, 13.5, 1.5, 3.0],    # Tuesday
+    [12.0, 13.5, 1.5, 3.0,   10.5, 12.0],  # Wednesday
+    [1.5, 3.0,   10.5, 12.0, 9.0, 10.5],   # Thursday
+    [10.5, 12.0, 9.0, 10.5,  4.5, 6.0],    # Friday
+    [9.0, 10.5,  4.5, 6.0,   8.0, 9.5],    # Saturday
+    [4.5, 6.0,   8.0, 9.5,   3.0, 4.5],    # Sunday
+], dtype=np.float64)
+
+
+def daylight_segments_batch(sunrise: np.ndarray, sunset: np.ndarray, parts: int = 8) -> np.ndarray:
+    """
+    Split each day's sunrise→sunset span into equal parts.
+    
+    Args:
+        sunrise: datetime64 array of sunrises
+        sunset: datetime64 array of sunsets (same shape)
+        parts: Number of segments per day (8 for Rahu/Yama/Gulika, 12 for hora)
+        
+    Returns:
+        (N, parts + 1) datetime64 array of segment edges; row i runs from
+        sunrise[i] to sunset[i].
+    """
+    sunrise = np.asarray(sunrise, dtype='datetime64[us]')
+    span = np.asarray(sunset, dtype='datetime64[us]') - sunrise
+    steps = np.arange(parts + 1, dtype=np.int64)
+    return sunrise[:, None] + (span[:, None] * steps[None, :]) // parts
+
+
 def compute_rahu_yama_gulikai(date_obj: date, lat: float, lon: float, tz: str) -> Dict[str, Any]:
     """
     Calculate Rahu Kalam, Yama Gandam, and Gulikai Kalam.
@@ -195,64 +398,34 @@ def compute_rahu_yama_gulikai(date_obj: date, lat: float, lon: float, tz: str) -
     Returns:
         Dictionary with timing information
         
+    Looks up sunrise/sunset itself; callers that already have them should
+    use rahu_yama_gulikai_from_sun() to skip the extra search.
+    """
+    sunrise, sunset = get_sunrise_sunset(date_obj, lat, lon, tz)
+    return rahu_yama_gulikai_from_sun(sunrise, sunset)
+
+
+def rahu_yama_gulikai_from_sun(sunrise: datetime, sunset: datetime) -> Dict[str, Any]:
+    """
+    Calculate Rahu Kalam, Yama Gandam, and Gulikai Kalam from known sun times.
+    
+    Args:
+        sunrise: Local sunrise (timezone-aware)
+        sunset: Local sunset (timezone-aware)
+        
+    Returns:
+        Dictionary with timing information
+        
     Formula:
         - Rahu Kalam: 1.5 hours, varies by weekday
         - Yama Gandam: 1.5 hours, varies by weekday  
         - Gulikai Kalam: 1.5 hours, varies by weekday
         - Times are calculated from sunrise
     """
-    # Get sunrise and sunset
-    sunrise, sunset = get_sunrise_sunset(date_obj, lat, lon, tz)
-    
-    # Calculate day duration
-    day_duration = sunset - sunrise
-    day_hours = day_duration.total_seconds() / 3600
-    
-    # Get weekday (0=Monday, 6=Sunday)
-    weekday = date_obj.weekday()
-    
-    # Rahu Kalam periods (1.5 hours each)
-    rahu_periods = [
-        (8, 9.5),   # Monday
-        (3, 4.5),   # Tuesday
-        (12, 13.5), # Wednesday
-        (1.5, 3),   # Thursday
-        (10.5, 12), # Friday
-        (9, 10.5),  # Saturday
-        (4.5, 6)    # Sunday
-    ]
-    
-    # Yama Gandam periods
-    yama_periods = [
-        (3, 4.5),   # Monday
-        (12, 13.5), # Tuesday
-        (1.5, 3),   # Wednesday
-        (10.5, 12), # Thursday
-        (9, 10.5),  # Friday
-        (4.5, 6),   # Saturday
-        (8, 9.5)    # Sunday
-    ]
-    
-    # Gulikai Kalam periods
-    gulikai_periods = [
-        (12, 13.5), # Monday
-        (1.5, 3),   # Tuesday
-        (10.5, 12), # Wednesday
-        (9, 10.5),  # Thursday
-        (4.5, 6),   # Friday
-        (8, 9.5),   # Saturday
-        (3, 4.5)    # Sunday
-    ]
-    
-    # Calculate actual times
-    def get_time_from_period(start_hour, end_hour):
-        start_time = sunrise + timedelta(hours=start_hour)
-        end_time = sunrise + timedelta(hours=end_hour)
-        return start_time, end_time
-    
-    rahu_start, rahu_end = get_time_from_period(*rahu_periods[weekday])
-    yama_start, yama_end = get_time_from_period(*yama_periods[weekday])
-    gulikai_start, gulikai_end = get_time_from_period(*gulikai_periods[weekday])
+    # (start, end) hours after sunrise for each weekday (0=Monday, 6=Sunday)
+    rahu_start, rahu_end, yama_start, yama_end, gulikai_start, gulikai_end = (
+        sunrise + timedelta(hours=h) for h in _RYG_PERIODS[sunrise.weekday()].tolist()
+    )
     
     return {
         "rahu_kalam": {
@@ -273,6 +446,12 @@ def compute_rahu_yama_gulikai(date_obj: date, lat: float, lon: float, tz: str) -
     }
 
 
+# Hora rulers for the 12 day horas: Sun, Venus, Mercury, Moon, Saturn,
+# Jupiter, Mars, repeating
+HORA_PLANETS = ("Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars")
+_HORA_RULERS = tuple(HORA_PLANETS[i % 7] for i in range(12))
+
+
 def compute_hora(date_obj: date, lat: float, lon: float, tz: str) -> List[Dict[str, Any]]:
     """
     Calculate Hora (planetary hours) for the day.
@@ -286,40 +465,56 @@ def compute_hora(date_obj: date, lat: float, lon: float, tz: str) -> List[Dict[s
     Returns:
         List of hora periods with planetary rulers
         
+    Looks up sunrise/sunset itself; callers that already have them should
+    use hora_from_sun() to skip the extra search.
+    """
+    sunrise, sunset = get_sunrise_sunset(date_obj, lat, lon, tz)
+    return hora_from_sun(sunrise, sunset)
+
+
+def hora_from_sun(sunrise: datetime, sunset: datetime) -> List[Dict[str, Any]]:
+    """
+    Calculate Hora (planetary hours) from known sun times.
+    
+    Args:
+        sunrise: Local sunrise (timezone-aware)
+        sunset: Local sunset (timezone-aware)
+        
+    Returns:
+        List of hora periods with planetary rulers
+        
     Formula:
         - Day divided into 12 horas
         - Each hora ruled by a planet in sequence
         - Sequence: Sun, Venus, Mercury, Moon, Saturn, Jupiter, Mars
         - Repeats for 12 horas
     """
-    sunrise, sunset = get_sunrise_sunset(date_obj, lat, lon, tz)
-    
     # Calculate day duration
     day_duration = sunset - sunrise
     hora_duration = day_duration / 12
     
-    # Planetary sequence
-    planets = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
-    
-    horas = []
-    current_time = sunrise
+    # All 13 hora boundaries in one datetime64 pass. Wall-clock arithmetic,
+    # the same as adding timedeltas to an aware datetime.
+    tzinfo = sunrise.tzinfo
+    edges = [
+        edge.replace(tzinfo=tzinfo)
+        for edge in daylight_segments_batch(
+            np.array([sunrise.replace(tzinfo=None)], dtype='datetime64[us]'),
+            np.array([sunset.replace(tzinfo=None)], dtype='datetime64[us]'),
+            parts=12,
+        )[0].tolist()
+    ]
     
-    for i in range(12):
-        planet = planets[i % 7]
-        start_time = current_time
-        end_time = current_time + hora_duration
-        
-        horas.append({
+    return [
+        {
             "hora_number": i + 1,
             "planet": planet,
-            "start": start_time,
-            "end": end_time,
+            "start": edges[i],
+            "end": edges[i + 1],
             "duration": hora_duration
-        })
-        
-        current_time = end_time
-    
-    return horas
+        }
+        for i, planet in enumerate(_HORA_RULERS)
+    ]
 
 
 def compute_gowri_nalla(date_obj: date, lat: float, lon: float, tz: str) -> Dict[str, Any]:
@@ -335,18 +530,29 @@ def compute_gowri_nalla(date_obj: date, lat: float, lon: float, tz: str) -> Dict
     Returns:
         Dictionary with Gowri timings
         
+    Looks up sunrise/sunset itself; callers that already have them should
+    use gowri_nalla_from_sun() to skip the extra search.
+    """
+    sunrise, sunset = get_sunrise_sunset(date_obj, lat, lon, tz)
+    return gowri_nalla_from_sun(sunrise, sunset)
+
+
+def gowri_nalla_from_sun(sunrise: datetime, sunset: datetime) -> Dict[str, Any]:
+    """
+    Calculate Gowri Panchangam (auspicious times) from known sun times.
+    
+    Args:
+        sunrise: Local sunrise (timezone-aware)
+        sunset: Local sunset (timezone-aware)
+        
+    Returns:
+        Dictionary with Gowri timings
+        
     Formula:
         - Based on tithi and nakshatra
         - Different periods for different activities
         - Auspicious and inauspicious times
     """
-    # Get sunrise and sunset
-    sunrise, sunset = get_sunrise_sunset(date_obj, lat, lon, tz)
-    
-    # Calculate day duration
-    day_duration = sunset - sunrise
-    day_hours = day_duration.total_seconds() / 3600
-    
     # Gowri periods (approximate, varies by location and tradition)
     gowri_periods = {
         "amrutha": (sunrise + timedelta(hours=6), sunrise + timedelta(hours=7.5)),
@@ -381,19 +587,54 @@ def assemble_panchangam(date_obj: date, lat: float, lon: float, tz: str,
     Returns:
         Complete panchangam dictionary with all calculated elements using authentic Vedic calculations
         
-    Uses Swiss Ephemeris-based panchangam library for accurate calculations.
+    Times (sunrise/sunset, periods, horas) are timezone-aware datetimes;
+    JSON encoders (FastAPI's, orjson) render them as ISO 8601 strings.
+    
+    Results are memoized per (date, lat/lon rounded to 2 decimals ≈ 1 km, tz,
+    settings); astronomical data for a given day never changes, so entries
+    don't expire. Nested values are shared between callers, so treat the
+    result as read-only; assemble_panchangam.cache_clear() empties the cache.
     """
     if settings is None:
         settings = {}
+    if isinstance(date_obj, str):
+        date_obj = date.fromisoformat(date_obj)
     
+    try:
+        settings_key = tuple(sorted(settings.items()))
+        hash(settings_key)
+    except TypeError:
+        # Unhashable setting values: compute without the cache
+        return _compute_panchangam(date_obj, lat, lon, tz, settings)
+    
+    cached = _cached_panchangam(date_obj, round(lat, 2), round(lon, 2), tz, settings_key)
+    # Echo the caller's own location and settings rather than the cache key's
+    return {
+        **cached,
+        "location": {"latitude": lat, "longitude": lon, "timezone": tz},
+        "settings": settings,
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_panchangam(date_obj: date, lat: float, lon: float, tz: str,
+                       settings_key: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    return _compute_panchangam(date_obj, lat, lon, tz, dict(settings_key))
+
+
+assemble_panchangam.cache_clear = _cached_panchangam.cache_clear
+
+
+def _compute_panchangam(date_obj: date, lat: float, lon: float, tz: str,
+                        settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Uncached assemble_panchangam, using the Swiss Ephemeris-based panchangam
+    library for accurate calculations.
+    """
     try:
         # Import the authentic pyswisseph-based panchangam library
         from ..vedic_panchangam import Panchangam, City
         
-        # Convert date to proper format if needed
-        if isinstance(date_obj, str):
-            date_obj = date.fromisoformat(date_obj)
-        
         # Create city object for the location
         city = City(name="UserLocation", latitude=lat, longitude=lon, timezone=tz)
         
@@ -406,13 +647,14 @@ def assemble_panchangam(date_obj: date, lat: float, lon: float, tz: str,
         nakshatra = panch.nakshatra
         yoga = panch.yoga
         karana = panch.karana
-        sunrise = panch.sunrise
-        sunset = panch.sunset
         
-        # Calculate timing elements using existing functions (these are still accurate)
-        rahu_yama_gulikai = compute_rahu_yama_gulikai(date_obj, lat, lon, tz)
-        horas = compute_hora(date_obj, lat, lon, tz)
-        gowri = compute_gowri_nalla(date_obj, lat, lon, tz)
+        # Calculate timing elements from a single sunrise/sunset search
+        sunrise_dt, sunset_dt = get_sunrise_sunset(
+            date_obj, lat, lon, tz, high_precision=bool(settings.get("high_precision"))
+        )
+        rahu_yama_gulikai = rahu_yama_gulikai_from_sun(sunrise_dt, sunset_dt)
+        horas = hora_from_sun(sunrise_dt, sunset_dt)
+        gowri = gowri_nalla_from_sun(sunrise_dt, sunset_dt)
         
         # Assemble API response with authentic Swiss Ephemeris calculations
         result = {
@@ -422,8 +664,8 @@ def assemble_panchangam(date_obj: date, lat: float, lon: float, tz: str,
                 "longitude": lon,
                 "timezone": tz
             },
-            "sunrise": sunrise.strftime('%Y-%m-%dT%H:%M:%S') if sunrise else None,
-            "sunset": sunset.strftime('%Y-%m-%dT%H:%M:%S') if sunset else None,
+            "sunrise": sunrise_dt,
+            "sunset": sunset_dt,
             "tithi": {
                 "number": tithi.index if hasattr(tithi, 'index') else 1,
                 "name": tithi.name_english if hasattr(tithi, 'name_english') else "Unknown",
@@ -454,8 +696,8 @@ def assemble_panchangam(date_obj: date, lat: float, lon: float, tz: str,
                 {
                     "hora_number": h["hora_number"],
                     "planet": h["planet"],
-                    "start": h["start"].isoformat(),
-                    "end": h["end"].isoformat()
+                    "start": h["start"],
+                    "end": h["end"]
                 }
                 for h in horas
             ],
@@ -483,13 +725,22 @@ def _assemble_panchangam_fallback(date_obj: date, lat: float, lon: float, tz: st
     if settings is None:
         settings = {}
     
-    # Get sunrise and sunset using modern API
-    sunrise_iso, sunset_iso = sunrise_sunset_local(date_obj.isoformat(), lat, lon, tz)
+    # Get sunrise and sunset using modern API; this is the only sun search
+    sunrise_local, sunset_local = sunrise_sunset_local_dt(
+        date_obj.isoformat(), lat, lon, tz, high_precision=bool(settings.get("high_precision"))
+    )
+    if sunrise_local and sunset_local:
+        sunrise_dt, sunset_dt = sunrise_local, sunset_local
+    else:
+        # Same approximate times AstronomyEngine.sunrise_sunset falls back to
+        base = datetime.combine(date_obj, datetime.min.time()).replace(tzinfo=_zi(tz))
+        sunrise_dt, sunset_dt = base.replace(hour=6), base.replace(hour=18)
     
     # Calculate sun and moon positions at local noon for day-level calculations
-    import zoneinfo
-    local_noon = datetime.fromisoformat(f"{date_obj.isoformat()}T12:00:00").replace(tzinfo=zoneinfo.ZoneInfo(tz))
-    sun_long, moon_long = sun_moon_ecliptic_longitudes(local_noon, lat, lon)
+    local_noon = datetime.fromisoformat(f"{date_obj.isoformat()}T12:00:00").replace(tzinfo=_zi(tz))
+    sun_long, moon_long = tabulated_sun_moon_longitudes(
+        local_noon, apparent=bool(settings.get("apparent_positions"))
+    )
     
     # Calculate panchangam elements
     tithi_num, tithi_progress = compute_tithi(sun_long, moon_long)
@@ -498,15 +749,11 @@ def _assemble_panchangam_fallback(date_obj: date, lat: float, lon: float, tz: st
     karana_name, karana_progress = compute_karana(tithi_num, tithi_progress)
     
     # Calculate timing elements
-    rahu_yama_gulikai = compute_rahu_yama_gulikai(date_obj, lat, lon, tz)
-    horas = compute_hora(date_obj, lat, lon, tz)
-    gowri = compute_gowri_nalla(date_obj, lat, lon, tz)
+    rahu_yama_gulikai = rahu_yama_gulikai_from_sun(sunrise_dt, sunset_dt)
+    horas = hora_from_sun(sunrise_dt, sunset_dt)
+    gowri = gowri_nalla_from_sun(sunrise_dt, sunset_dt)
     
-    # Determine tithi name
-    if tithi_num <= 15:
-        tithi_name = f"Shukla {tithi_num}"
-    else:
-        tithi_name = f"Krishna {tithi_num - 15}"
+    tithi_name = TITHI_NAMES[tithi_num]
     
     return {
         "date": date_obj.isoformat(),
@@ -515,8 +762,8 @@ def _assemble_panchangam_fallback(date_obj: date, lat: float, lon: float, tz: st
             "longitude": lon,
             "timezone": tz
         },
-        "sunrise": sunrise_iso,
-        "sunset": sunset_iso,
+        "sunrise": sunrise_local,
+        "sunset": sunset_local,
         "tithi": {
             "number": tithi_num,
             "name": tithi_name,
@@ -547,8 +794,8 @@ def _assemble_panchangam_fallback(date_obj: date, lat: float, lon: float, tz: st
             {
                 "hora_number": h["hora_number"],
                 "planet": h["planet"],
-                "start": h["start"].isoformat(),
-                "end": h["end"].isoformat()
+                "start": h["start"],
+                "end": h["end"]
             }
             for h in horas
         ],
@@ -1,19 +0,0 @@
-def tz_from_latlon(lat: float, lon: float) -> str:
-    # implement timezone lookup, e.g., using timezonefinder
-    return "Asia/Kolkata"
-
-def solar_events(date, lat, lon, tz):
-    # implement sunrise/sunset using astral or skyfield
-    return "06:12", "18:35"
-
-def day_segments(sr, ss, weekday: int):
-    # calculate rahukaalam, yamagandam, gulikai timings
-    return "07:30-09:00", "10:30-12:00", "15:00-16:30"
-
-def vedic_elements(date, lat, lon, tz):
-    # placeholder, real logic needs panchangam algorithms
-    return "Shukla Pratipada", "Ashwini", "Vishkambha", "Bava"
-
-def cache_and_return(lat, lon, tz, date, payload):
-    # store in DB or Redis if needed
-    return payload
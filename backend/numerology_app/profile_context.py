@@ -4,25 +4,45 @@ Profile context management for personalized Vedic astrology experience.
 Handles user preferences, language settings, and personalization.
 """
 
-from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, computed_field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
+from typing_extensions import TypedDict
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 import logging
+import orjson
+import time
 
 logger = logging.getLogger(__name__)
 
-class UserPreferences(BaseModel):
+class UserPreferences(TypedDict, total=False):
     """User preferences for astrology calculations."""
-    language: str = "en"
-    timezone: str = "Asia/Kolkata"
-    calculation_method: str = "Lahiri"  # Ayanamsa method
-    chart_style: str = "North Indian"  # North Indian, South Indian, East Indian
-    show_degrees: bool = True
-    show_nakshatras: bool = True
-    show_divisions: bool = False
-    notification_enabled: bool = True
-    email_notifications: bool = True
-    sms_notifications: bool = False
+    language: str
+    timezone: str
+    calculation_method: str  # Ayanamsa method
+    chart_style: str  # North Indian, South Indian, East Indian
+    show_degrees: bool
+    show_nakshatras: bool
+    show_divisions: bool
+    notification_enabled: bool
+    email_notifications: bool
+    sms_notifications: bool
+
+_PREFS_DEFAULTS: UserPreferences = {
+    "language": "en",
+    "timezone": "Asia/Kolkata",
+    "calculation_method": "Lahiri",
+    "chart_style": "North Indian",
+    "show_degrees": True,
+    "show_nakshatras": True,
+    "show_divisions": False,
+    "notification_enabled": True,
+    "email_notifications": True,
+    "sms_notifications": False,
+}
+_BLANK_PREFS: UserPreferences = MappingProxyType(_PREFS_DEFAULTS)  # type: ignore[assignment]
 
 class PersonalizationSettings(BaseModel):
     """Personalization settings for user experience."""
@@ -32,8 +52,19 @@ class PersonalizationSettings(BaseModel):
     interest_areas: List[str] = []  # career, love, health, finance, spirituality
     experience_level: str = "beginner"  # beginner, intermediate, advanced
     custom_reminders: Dict[str, Any] = {}
-    created_at: datetime
-    updated_at: datetime
+    # Nanosecond epoch stamps; converted to datetimes only when serialized
+    created_at_ns: int
+    updated_at_ns: int
+
+    @computed_field
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+
+    @computed_field
+    @property
+    def updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9)
 
 class ProfileContext:
     """Main class for managing user profile context."""
@@ -45,29 +76,25 @@ class ProfileContext:
     def get_user_preferences(self) -> UserPreferences:
         """Get user preferences."""
         # TODO: Implement database retrieval
-        if not self.settings:
-            self.settings = PersonalizationSettings(
-                user_id=self.user_id,
-                preferences=UserPreferences(),
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-        return self.settings.preferences
+        # Unsaved users share the read-only defaults; settings are only
+        # materialised on the first update.
+        return self.settings.preferences if self.settings else _BLANK_PREFS
     
     def update_user_preferences(self, preferences: UserPreferences) -> bool:
         """Update user preferences."""
         try:
             # TODO: Implement database update
+            now_ns = time.time_ns()
             if not self.settings:
                 self.settings = PersonalizationSettings(
                     user_id=self.user_id,
-                    preferences=preferences,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
+                    preferences={**_PREFS_DEFAULTS, **preferences},
+                    created_at_ns=now_ns,
+                    updated_at_ns=now_ns
                 )
             else:
-                self.settings.preferences = preferences
-                self.settings.updated_at = datetime.now()
+                self.settings.preferences = {**_PREFS_DEFAULTS, **preferences}
+                self.settings.updated_at_ns = now_ns
             
             logger.info(f"Updated preferences for user {self.user_id}")
             return True
@@ -80,13 +107,13 @@ class ProfileContext:
         preferences = self.get_user_preferences()
         
         return {
-            "language": preferences.language,
-            "timezone": preferences.timezone,
-            "ayanamsa_method": preferences.calculation_method,
-            "chart_style": preferences.chart_style,
-            "show_degrees": preferences.show_degrees,
-            "show_nakshatras": preferences.show_nakshatras,
-            "show_divisions": preferences.show_divisions
+            "language": preferences["language"],
+            "timezone": preferences["timezone"],
+            "ayanamsa_method": preferences["calculation_method"],
+            "chart_style": preferences["chart_style"],
+            "show_degrees": preferences["show_degrees"],
+            "show_nakshatras": preferences["show_nakshatras"],
+            "show_divisions": preferences["show_divisions"]
         }
     
     def get_notification_settings(self) -> Dict[str, bool]:
@@ -94,9 +121,9 @@ class ProfileContext:
         preferences = self.get_user_preferences()
         
         return {
-            "notifications_enabled": preferences.notification_enabled,
-            "email_notifications": preferences.email_notifications,
-            "sms_notifications": preferences.sms_notifications
+            "notifications_enabled": preferences["notification_enabled"],
+            "email_notifications": preferences["email_notifications"],
+            "sms_notifications": preferences["sms_notifications"]
         }
     
     def get_personalized_content(self, content_type: str) -> Dict[str, Any]:
@@ -105,7 +132,7 @@ class ProfileContext:
         
         # TODO: Implement content personalization logic
         return {
-            "language": preferences.language,
+            "language": preferences["language"],
             "experience_level": self.settings.experience_level if self.settings else "beginner",
             "interest_areas": self.settings.interest_areas if self.settings else [],
             "content_type": content_type
@@ -121,40 +148,57 @@ class ProfileContext:
             logger.error(f"Error saving settings for user {self.user_id}: {e}")
             return False
 
+_LANG_MAP = MappingProxyType({
+    "en": "English",
+    "hi": "Hindi",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "kn": "Kannada",
+    "ml": "Malayalam",
+    "bn": "Bengali",
+    "gu": "Gujarati",
+    "mr": "Marathi",
+    "pa": "Punjabi"
+})
+_LANG_KEYS = frozenset(_LANG_MAP)
+
+def get_supported_languages() -> Mapping[str, str]:
+    """Get list of supported languages (read-only)."""
+    return _LANG_MAP
+
+def is_language_supported(language_code: str) -> bool:
+    """Check if language is supported."""
+    return language_code in _LANG_KEYS
+
+def get_language_name(language_code: str) -> str:
+    """Get language name from code."""
+    return _LANG_MAP.get(language_code, "Unknown")
+
+_LOCALES_DIR = Path(__file__).with_name("locales")
+
+@lru_cache(maxsize=len(_LANG_MAP))
+def _language_pack(language: str) -> Mapping[str, str]:
+    """Load ``locales/<language>.json`` on first use; languages nobody asks for stay unloaded."""
+    path = _LOCALES_DIR / f"{language}.json"
+    if language not in _LANG_KEYS or not path.is_file():
+        return MappingProxyType({})
+    return MappingProxyType(orjson.loads(path.read_bytes()))
+
+@lru_cache(maxsize=4096)
+def get_localized_content(content_key: str, language: str = "en") -> str:
+    """Get localized content for a given key."""
+    text = _language_pack(language).get(content_key)
+    if text is not None:
+        return text
+    # No translation yet: return the key as placeholder
+    return f"[{language}] {content_key}"
+
 class MultiLanguageSupport:
     """Multi-language support for astrology content."""
-    
-    SUPPORTED_LANGUAGES = {
-        "en": "English",
-        "hi": "Hindi", 
-        "ta": "Tamil",
-        "te": "Telugu",
-        "kn": "Kannada",
-        "ml": "Malayalam",
-        "bn": "Bengali",
-        "gu": "Gujarati",
-        "mr": "Marathi",
-        "pa": "Punjabi"
-    }
-    
-    @classmethod
-    def get_supported_languages(cls) -> Dict[str, str]:
-        """Get list of supported languages."""
-        return cls.SUPPORTED_LANGUAGES
-    
-    @classmethod
-    def is_language_supported(cls, language_code: str) -> bool:
-        """Check if language is supported."""
-        return language_code in cls.SUPPORTED_LANGUAGES
-    
-    @classmethod
-    def get_language_name(cls, language_code: str) -> str:
-        """Get language name from code."""
-        return cls.SUPPORTED_LANGUAGES.get(language_code, "Unknown")
-    
-    @classmethod
-    def get_localized_content(cls, content_key: str, language: str = "en") -> str:
-        """Get localized content for a given key."""
-        # TODO: Implement actual localization
-        # For now, return the key as placeholder
-        return f"[{language}] {content_key}"
+
+    SUPPORTED_LANGUAGES = _LANG_MAP
+
+    get_supported_languages = staticmethod(get_supported_languages)
+    is_language_supported = staticmethod(is_language_supported)
+    get_language_name = staticmethod(get_language_name)
+    get_localized_content = staticmethod(get_localized_content)
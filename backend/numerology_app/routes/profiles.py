@@ -1,22 +1,30 @@
 ﻿from fastapi import APIRouter, Depends, HTTPException, status
 from ..schemas.profiles import ProfileCreate, ProfileUpdate, ProfileOut
+from ..schemas.common import trusted
 from ..deps import get_db, get_current_user
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 
+# ProfileOut fields that may not be None (name, dob, ...)
+_REQUIRED_FIELDS = frozenset(k for k, f in ProfileOut.model_fields.items() if f.is_required())
+
 @router.post("", response_model=ProfileOut, status_code=201)
 def create_profile(body: ProfileCreate, db=Depends(get_db), user=Depends(get_current_user)):
-    return ProfileOut(id=1, **body.dict())
+    return trusted(ProfileOut, id=1, **body.model_dump(mode='python', exclude_none=True))
 
 @router.get("/{profile_id}", response_model=ProfileOut)
 def get_profile(profile_id: int, db=Depends(get_db), user=Depends(get_current_user)):
     if profile_id != 1:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
-    return ProfileOut(id=1, name="You", dob="1990-01-01")
+    return trusted(ProfileOut, id=1, name="You", dob="1990-01-01")
 
 @router.patch("/{profile_id}", response_model=ProfileOut)
 def update_profile(profile_id: int, body: ProfileUpdate, db=Depends(get_db), user=Depends(get_current_user)):
-    return ProfileOut(id=profile_id, name=body.name or "You", dob=body.dob or "1990-01-01")
+    existing = {"name": "You", "dob": "1990-01-01"}
+    # Only fields the client sent; null can't clear a required field
+    changes = {k: v for k, v in body.model_dump(exclude_unset=True).items()
+               if v is not None or k not in _REQUIRED_FIELDS}
+    return trusted(ProfileOut, id=profile_id, **{**existing, **changes})
 
 @router.delete("/{profile_id}", status_code=204)
 def delete_profile(profile_id: int, db=Depends(get_db), user=Depends(get_current_user)):
@@ -1,27 +1,94 @@
-﻿from fastapi import APIRouter, Depends, Header, Request
+﻿import os, hmac, hashlib, time
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from pydantic import TypeAdapter
 from ..schemas.store import ProductOut, OrderCreate, OrderOut, SubscriptionCreate, SubscriptionOut
+from ..schemas.common import trusted
 from ..deps import get_db, get_current_user
 
 router = APIRouter(prefix="/store", tags=["store"])
 
-@router.get("/products", response_model=list[ProductOut])
+_PRODUCTS_ADAPTER = TypeAdapter(list[ProductOut])
+_PRODUCTS = [trusted(ProductOut, id=1, name="Daily Horoscope", price_cents=4999, currency="INR", active=True)]
+
+@router.get("/products", response_model=None, responses={200: {"model": list[ProductOut]}})
 def list_products(db=Depends(get_db)):
-    return [ProductOut(id=1, name="Daily Horoscope", price_cents=4999)]
+    return Response(content=_PRODUCTS_ADAPTER.dump_json(_PRODUCTS), media_type="application/json")
 
 @router.post("/orders", response_model=OrderOut, status_code=201)
 def create_order(body: OrderCreate, db=Depends(get_db), user=Depends(get_current_user)):
-    return OrderOut(id=1, amount_cents=body.quantity*4999, currency="INR", payment_url="https://pay/link", status="pending")
+    return trusted(OrderOut, id=1, amount_cents=body.quantity*4999, currency="INR", payment_url="https://pay/link", status="pending")
 
 @router.post("/subscriptions", response_model=SubscriptionOut, status_code=201)
 def start_subscription(body: SubscriptionCreate, db=Depends(get_db), user=Depends(get_current_user)):
-    return SubscriptionOut(id=1, status="trialing")
+    return trusted(SubscriptionOut, id=1, status="trialing")
+
+def _keyed(secret: str | None):
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256) if secret else None
+
+# Keyed once per gateway; each request works on a copy.
+_RAZORPAY_HMAC = _keyed(os.getenv("RAZORPAY_WEBHOOK_SECRET"))
+_STRIPE_HMAC = _keyed(os.getenv("STRIPE_WEBHOOK_SECRET"))
+_WEBHOOK_MAX_BYTES = 1 << 20
+_STRIPE_TOLERANCE_S = 300  # Stripe's default replay window
+
+async def _read_signed(request: Request, mac) -> bytes:
+    """Read the body chunk by chunk, feeding ``mac`` as it arrives."""
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf.extend(chunk)
+        if len(buf) > _WEBHOOK_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        if mac is not None:
+            mac.update(chunk)
+    return bytes(buf)
+
+def _sig_matches(mac, signature: str) -> bool:
+    """Constant-time check of ``mac`` against a header signature.
+
+    Compared as bytes: header values are latin-1 text, and compare_digest
+    raises on non-ASCII str input.
+    """
+    return hmac.compare_digest(mac.hexdigest().encode(), signature.encode("latin-1"))
+
+def _parse(raw: bytes):
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON")
 
 @router.post("/webhooks/razorpay", status_code=202)
 async def razorpay_webhook(request: Request, x_razorpay_signature: str | None = Header(None)):
-    raw = await request.body()
+    mac = _RAZORPAY_HMAC.copy() if _RAZORPAY_HMAC else None
+    if mac is not None and not x_razorpay_signature:
+        raise HTTPException(status_code=400, detail="Missing signature")
+    raw = await _read_signed(request, mac)
+    if mac is not None and not _sig_matches(mac, x_razorpay_signature):
+        raise HTTPException(status_code=400, detail="Invalid signature")
+    _parse(raw)
     return {"message": "accepted"}
 
 @router.post("/webhooks/stripe", status_code=202)
 async def stripe_webhook(request: Request, stripe_signature: str | None = Header(None)):
-    raw = await request.body()
+    mac = _STRIPE_HMAC.copy() if _STRIPE_HMAC else None
+    if mac is not None:
+        # Stripe signs "<timestamp>.<body>"; the header is "t=...,v1=...[,v1=...]"
+        parts = [kv.split("=", 1) for kv in (stripe_signature or "").split(",") if "=" in kv]
+        ts = next((v for k, v in parts if k == "t"), None)
+        sigs = [v for k, v in parts if k == "v1"]
+        if not ts or not sigs:
+            raise HTTPException(status_code=400, detail="Missing signature")
+        # The timestamp is signed; reject stale ones so captured requests can't be replayed
+        try:
+            age = abs(time.time() - int(ts))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid signature timestamp")
+        if age > _STRIPE_TOLERANCE_S:
+            raise HTTPException(status_code=400, detail="Signature timestamp outside tolerance")
+        mac.update(ts.encode() + b".")
+    raw = await _read_signed(request, mac)
+    if mac is not None:
+        if not any(_sig_matches(mac, s) for s in sigs):
+            raise HTTPException(status_code=400, detail="Invalid signature")
+    _parse(raw)
     return {"message": "accepted"}
@@ -1,5 +1,17 @@
-﻿from pydantic import BaseModel, Field, EmailStr, ConfigDict
-from typing import Optional
+﻿from fastapi import Response
+from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from typing import Optional, TypeVar
+
+M = TypeVar("M", bound=BaseModel)
+
+def trusted(model_cls: type[M], **kw) -> M:
+    """Build a response model from server-side data without re-validating it."""
+    return model_cls.model_construct(**kw)
+
+def json_response(obj: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a response model straight to JSON bytes, skipping FastAPI's re-validation."""
+    return Response(content=obj.__pydantic_serializer__.to_json(obj), status_code=status_code,
+                    media_type="application/json")
 
 class APIMessage(BaseModel):
     message: str = Field(..., examples=["ok"])
@@ -1,26 +1,48 @@
-﻿import os, time, hmac, hashlib, base64
+﻿import os, time, hmac, hashlib
+import orjson
+
+try:  # SIMD base64 when available; same API as the stdlib module
+    import pybase64 as base64
+except ImportError:  # pragma: no cover
+    import base64
 from typing import Optional, Any, Dict
 from pydantic import BaseModel
-from passlib.context import CryptContext
-
-PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
 
 JWT_SECRET = os.getenv("JWT_SECRET", "CHANGE_ME")
 JWT_ISSUER = os.getenv("JWT_ISSUER", "astrooverz")
 JWT_TTL_SECONDS = int(os.getenv("JWT_TTL_SECONDS", "86400"))  # 24h
 
+# bcrypt only looks at the first 72 bytes; truncate like passlib did so
+# longer passwords neither raise nor change meaning for existing hashes.
+def _pw_bytes(password: str) -> bytes:
+    return password.encode()[:72]
+
 def hash_password(password: str) -> str:
-    return PWD_CONTEXT.hash(password)
+    return bcrypt.hashpw(_pw_bytes(password), bcrypt.gensalt(rounds=12)).decode()
 
 def verify_password(password: str, hashed: str) -> bool:
-    return PWD_CONTEXT.verify(password, hashed)
+    try:
+        return bcrypt.checkpw(_pw_bytes(password), hashed.encode())
+    except ValueError:  # malformed hash
+        return False
+
+# Keyed once; each signature copies it instead of re-deriving the HMAC pads.
+_HMAC_TEMPLATE = hmac.new(JWT_SECRET.encode(), digestmod=hashlib.sha256)
+
+def _sign(data: bytes) -> bytes:
+    h = _HMAC_TEMPLATE.copy()
+    h.update(data)
+    return h.digest()
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
 
-def _b64url(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
 
-def _b64url_json(obj: Dict[str, Any]) -> str:
-    import json
-    return _b64url(json.dumps(obj, separators=(",", ":")).encode())
+# The header never changes, so encode it once.
+_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
 
 def create_jwt(sub: str, extra: Optional[dict] = None) -> str:
     now = int(time.time())
@@ -31,12 +53,9 @@ def create_jwt(sub: str, extra: Optional[dict] = None) -> str:
         "exp": now + JWT_TTL_SECONDS,
         **(extra or {}),
     }
-    header = {"alg": "HS256", "typ": "JWT"}
-    h = _b64url_json(header)
-    p = _b64url_json(payload)
-    to_sign = f"{h}.{p}".encode()
-    sig = hmac.new(JWT_SECRET.encode(), to_sign, hashlib.sha256).digest()
-    return f"{h}.{p}.{_b64url(sig)}"
+    to_sign = _HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+    sig = _sign(to_sign)
+    return (to_sign + b"." + _b64url(sig)).decode()
 
 class DecodedJWT(BaseModel):
     iss: str
@@ -45,14 +64,13 @@ class DecodedJWT(BaseModel):
     exp: int
 
 def decode_jwt(token: str) -> DecodedJWT:
-    import json
     h_b64, p_b64, s_b64 = token.split(".")
     to_sign = f"{h_b64}.{p_b64}".encode()
-    expected = hmac.new(JWT_SECRET.encode(), to_sign, hashlib.sha256).digest()
-    got = base64.urlsafe_b64decode(s_b64 + "==")
+    expected = _sign(to_sign)
+    got = _b64url_decode(s_b64)
     if not hmac.compare_digest(expected, got):
         raise ValueError("Invalid signature")
-    payload = json.loads(base64.urlsafe_b64decode(p_b64 + "=="))
+    payload = orjson.loads(_b64url_decode(p_b64))
     now = int(time.time())
     if payload.get("exp", 0) < now:
         raise ValueError("Token expired")
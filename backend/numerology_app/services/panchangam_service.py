@@ -1,10 +1,37 @@
-﻿from ..schemas.panchangam import PanchangamQuery, PanchangamOut
+﻿from datetime import date, datetime
+from ..schemas.panchangam import PanchangamQuery, PanchangamOut
+from ..schemas.common import trusted
 from ..adapters.timezone import tz_from_latlon
 from ..domain.astronomy import solar_events, fmt_hhmm
 from ..domain.vedic import day_segments, vedic_elements
 
 def _cache_key(q: PanchangamQuery, tz: str) -> str:
-    return f"panchangam:{q.date}:{q.lat:.4f}:{q.lon:.4f}:{tz}"
+    # Day ordinal and coordinates in 1e-4 degree units keep keys short and skip float formatting
+    return f"p:{q.date.toordinal()}:{round(q.lat * 1e4)}:{round(q.lon * 1e4)}:{tz}"
+
+_DAY_TTL = 24*3600
+
+def _grid(q: PanchangamQuery, tz: str) -> str:
+    # ~1 km grid: nearby observers share sunrise/sunset to well under a minute
+    return f"{q.date}:{round(q.lat, 2)}:{round(q.lon, 2)}:{tz}"
+
+async def _cached_solar_events(q: PanchangamQuery, tz: str, cache) -> tuple[datetime, datetime]:
+    key = f"solar:{_grid(q, tz)}"
+    hit = await cache.get(key)
+    if hit:
+        return datetime.fromisoformat(hit["sunrise"]), datetime.fromisoformat(hit["sunset"])
+    sr_dt, ss_dt = solar_events(q.date, round(q.lat, 2), round(q.lon, 2), tz)
+    await cache.set(key, {"sunrise": sr_dt.isoformat(), "sunset": ss_dt.isoformat()}, ttl=_DAY_TTL)
+    return sr_dt, ss_dt
+
+async def _cached_vedic_elements(q: PanchangamQuery, tz: str, cache) -> tuple[str, str, str, str]:
+    key = f"vedic:{_grid(q, tz)}"
+    hit = await cache.get(key)
+    if hit:
+        return tuple(hit["elements"])
+    elements = vedic_elements(q.date, round(q.lat, 2), round(q.lon, 2), tz)
+    await cache.set(key, {"elements": list(elements)}, ttl=_DAY_TTL)
+    return elements
 
 async def get_panchangam(q: PanchangamQuery, cache, settings) -> PanchangamOut:
     tz = q.tz or tz_from_latlon(q.lat, q.lon, default=settings.DEFAULT_TZ)
@@ -12,13 +39,14 @@ async def get_panchangam(q: PanchangamQuery, cache, settings) -> PanchangamOut:
     key = _cache_key(q, tz)
     cached = await cache.get(key)
     if cached:
-        return PanchangamOut(**cached)
+        return PanchangamOut.model_validate_json(cached)
 
-    sr_dt, ss_dt = solar_events(q.date, q.lat, q.lon, tz)
+    sr_dt, ss_dt = await _cached_solar_events(q, tz, cache)
     rahu, yama, gulika = day_segments(sr_dt, ss_dt, q.date.weekday())
-    tithi, nak, yoga, karana = vedic_elements(q.date, q.lat, q.lon, tz)
+    tithi, nak, yoga, karana = await _cached_vedic_elements(q, tz, cache)
 
-    payload = PanchangamOut(
+    out = trusted(
+        PanchangamOut,
         sunrise=fmt_hhmm(sr_dt),
         sunset=fmt_hhmm(ss_dt),
         rahukaalam=rahu,
@@ -28,7 +56,7 @@ async def get_panchangam(q: PanchangamQuery, cache, settings) -> PanchangamOut:
         nakshatra=nak,
         yoga=yoga,
         karana=karana,
-    ).model_dump()
+    )
 
-    await cache.set(key, payload, ttl=24*3600)
-    return PanchangamOut(**payload)
+    await cache.set(key, out.model_dump_json(), ttl=_DAY_TTL)
+    return out
@@ -4,15 +4,19 @@ Vedic chart calculations using Swiss Ephemeris.
 Provides natal chart, divisional charts (Vargas), and chart analysis.
 """
 
-import swisseph as swe
+from .ephe import swe
 import math
+import numpy as np
 from datetime import datetime, date, time
+from functools import cached_property
 from typing import Dict, List, Tuple, Optional
 import pytz
 import logging
 
 logger = logging.getLogger(__name__)
 
+NAKSHATRA_SPAN = 360.0 / 27.0
+
 class VedicChart:
     """Main class for Vedic chart calculations."""
     
@@ -78,42 +82,58 @@ class VedicChart:
             birth_time.hour + birth_time.minute/60.0 + birth_time.second/3600.0,
             swe.GREG_CAL
         )
-        
-        # Set ephemeris path
-        swe.set_ephe_path()
 
-    def calculate_planetary_positions(self) -> Dict[str, Dict]:
-        """Calculate positions of all planets."""
-        positions = {}
-        
+    # RAHU and KETU share swe.MEAN_NODE, so PLANET_NAMES cannot tell them apart.
+    _POSITION_NAMES = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+
+    def _planet_longitudes(self) -> np.ndarray:
+        """Tropical longitudes in _POSITION_NAMES order; NaN where swe failed."""
         planets = [self.SUN, self.MOON, self.MARS, self.MERCURY, self.JUPITER, self.VENUS, self.SATURN, self.RAHU]
-        
-        for planet in planets:
+        names = self._POSITION_NAMES
+
+        longs = np.empty(len(names), dtype=np.float64)
+        for i, planet in enumerate(planets):
             try:
-                # Calculate planet position
-                planet_pos = swe.calc_ut(self.jd, planet, swe.FLG_SWIEPH)[0]
-                longitude = planet_pos[0]
-                
-                # Convert to sign and degree
-                sign_num = int(longitude / 30)
-                degree_in_sign = longitude % 30
-                
-                # Calculate nakshatra
-                nakshatra_num = int(longitude / 13.333)
-                nakshatra_degree = longitude % 13.333
-                
-                positions[self.PLANET_NAMES[planet]] = {
-                    "longitude": longitude,
-                    "sign": self.SIGNS[sign_num],
-                    "degree": round(degree_in_sign, 2),
-                    "nakshatra": self.NAKSHATRAS[nakshatra_num],
-                    "nakshatra_lord": self.NAKSHATRAS_LORDS[nakshatra_num],
-                    "nakshatra_degree": round(nakshatra_degree, 2)
-                }
-                
+                longs[i] = swe.calc_ut(self.jd, planet, swe.FLG_SWIEPH)[0][0]
             except Exception as e:
-                logger.error(f"Error calculating position for {self.PLANET_NAMES[planet]}: {e}")
-                positions[self.PLANET_NAMES[planet]] = {
+                logger.error(f"Error calculating position for {names[i]}: {e}")
+                longs[i] = np.nan
+        # Ketu is always opposite Rahu
+        longs[-1] = (longs[-2] + 180.0) % 360.0
+        return longs
+
+    @cached_property
+    def _houses_raw(self):
+        """Placidus cusps and ascmc from a single swe.houses call."""
+        return swe.houses(self.jd, self.latitude, self.longitude, b'P')
+
+    def _house_cusps(self) -> Optional[np.ndarray]:
+        """The 12 house cusps (cusp 1 is the ascendant), or None if swe.houses failed."""
+        try:
+            return np.asarray(self._houses_raw[0], dtype=np.float64)
+        except Exception as e:
+            logger.error(f"Error calculating houses: {e}")
+            return None
+
+    @staticmethod
+    def _decompose(longs: np.ndarray) -> Tuple[list, ...]:
+        """Sign/degree/nakshatra breakdown of every longitude in one vectorised pass."""
+        ok = ~np.isnan(longs)
+        safe = np.where(ok, longs, 0.0)
+        return (
+            ok.tolist(),
+            safe.tolist(),
+            (safe // 30).astype(np.int8).tolist(),
+            np.round(safe % 30, 2).tolist(),
+            (safe / NAKSHATRA_SPAN).astype(np.int8).tolist(),
+            np.round(safe % NAKSHATRA_SPAN, 2).tolist(),
+        )
+
+    def _positions_from(self, cols) -> Dict[str, Dict]:
+        positions = {}
+        for name, valid, lon, s_i, deg, n_i, n_deg in zip(self._POSITION_NAMES, *cols):
+            if not valid:
+                positions[name] = {
                     "longitude": 0,
                     "sign": "Unknown",
                     "degree": 0,
@@ -121,73 +141,55 @@ class VedicChart:
                     "nakshatra_lord": "Unknown",
                     "nakshatra_degree": 0
                 }
-        
-        # Calculate Ketu (180 degrees from Rahu)
-        if "Rahu" in positions:
-            rahu_long = positions["Rahu"]["longitude"]
-            ketu_long = (rahu_long + 180) % 360
-            
-            sign_num = int(ketu_long / 30)
-            degree_in_sign = ketu_long % 30
-            nakshatra_num = int(ketu_long / 13.333)
-            nakshatra_degree = ketu_long % 13.333
-            
-            positions["Ketu"] = {
-                "longitude": ketu_long,
-                "sign": self.SIGNS[sign_num],
-                "degree": round(degree_in_sign, 2),
-                "nakshatra": self.NAKSHATRAS[nakshatra_num],
-                "nakshatra_lord": self.NAKSHATRAS_LORDS[nakshatra_num],
-                "nakshatra_degree": round(nakshatra_degree, 2)
+                continue
+            positions[name] = {
+                "longitude": lon,
+                "sign": self.SIGNS[s_i],
+                "degree": deg,
+                "nakshatra": self.NAKSHATRAS[n_i],
+                "nakshatra_lord": self.NAKSHATRA_LORDS[n_i],
+                "nakshatra_degree": n_deg
             }
-        
         return positions
 
-    def calculate_ascendant(self) -> Dict:
-        """Calculate ascendant (rising sign)."""
-        try:
-            # Calculate ascendant
-            asc_pos = swe.houses(self.jd, self.latitude, self.longitude, b'P')[0]
-            asc_longitude = asc_pos[0]
-            
-            sign_num = int(asc_longitude / 30)
-            degree_in_sign = asc_longitude % 30
-            
-            return {
-                "longitude": asc_longitude,
-                "sign": self.SIGNS[sign_num],
-                "degree": round(degree_in_sign, 2)
+    def _houses_from(self, cols) -> List[Dict]:
+        _, lons, signs, degs = cols[:4]
+        return [
+            {
+                "house": i + 1,
+                "longitude": lon,
+                "sign": self.SIGNS[s],
+                "degree": deg
             }
-        except Exception as e:
-            logger.error(f"Error calculating ascendant: {e}")
+            for i, (lon, s, deg) in enumerate(zip(lons, signs, degs))
+        ]
+
+    def _ascendant_from(self, cols) -> Dict:
+        if not cols[0]:
             return {
                 "longitude": 0,
                 "sign": "Unknown",
                 "degree": 0
             }
+        return {
+            "longitude": cols[1][0],
+            "sign": self.SIGNS[cols[2][0]],
+            "degree": cols[3][0]
+        }
+
+    def calculate_planetary_positions(self) -> Dict[str, Dict]:
+        """Calculate positions of all planets."""
+        return self._positions_from(self._decompose(self._planet_longitudes()))
+
+    def calculate_ascendant(self) -> Dict:
+        """Calculate ascendant (rising sign)."""
+        cusps = self._house_cusps()
+        return self._ascendant_from(self._decompose(cusps[:1] if cusps is not None else np.empty(0)))
 
     def calculate_houses(self) -> List[Dict]:
         """Calculate house cusps."""
-        try:
-            # Calculate house cusps
-            houses = swe.houses(self.jd, self.latitude, self.longitude, b'P')[0]
-            
-            house_data = []
-            for i, house_longitude in enumerate(houses):
-                sign_num = int(house_longitude / 30)
-                degree_in_sign = house_longitude % 30
-                
-                house_data.append({
-                    "house": i + 1,
-                    "longitude": house_longitude,
-                    "sign": self.SIGNS[sign_num],
-                    "degree": round(degree_in_sign, 2)
-                })
-            
-            return house_data
-        except Exception as e:
-            logger.error(f"Error calculating houses: {e}")
-            return []
+        cusps = self._house_cusps()
+        return self._houses_from(self._decompose(cusps)) if cusps is not None else []
 
     def calculate_divisional_chart(self, division: int) -> Dict:
         """Calculate divisional chart (Varga)."""
@@ -197,9 +199,16 @@ class VedicChart:
 
     def get_chart_summary(self) -> Dict:
         """Get complete chart summary."""
-        positions = self.calculate_planetary_positions()
-        ascendant = self.calculate_ascendant()
-        houses = self.calculate_houses()
+        # One vectorised breakdown over planets + cusps, sliced back afterwards
+        longs = self._planet_longitudes()
+        cusps = self._house_cusps()
+        if cusps is None:
+            cusps = np.empty(0)
+        cols = self._decompose(np.concatenate([longs, cusps]))
+        n = len(longs)
+        positions = self._positions_from(cols)
+        houses = self._houses_from([c[n:] for c in cols])
+        ascendant = self._ascendant_from([c[n:n + 1] for c in cols])
         
         return {
             "birth_data": {
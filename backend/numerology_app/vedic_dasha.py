@@ -4,14 +4,54 @@ Vedic Dasha calculations using Swiss Ephemeris.
 Provides Vimshottari Dasha, Antardasha, and other planetary periods.
 """
 
-import swisseph as swe
+from .ephe import swe
 import math
+from bisect import bisect_right
+from itertools import accumulate
 from datetime import datetime, date, time, timedelta
-from typing import Dict, List, Tuple, Optional
-import pytz
-import logging
+from functools import cached_property
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Sequence, Tuple, Optional
+import numpy as np
+
+from .jit import lazy_njit, prange
+
+_NAK = 360.0 / 27.0  # exact nakshatra span, 13°20'
+
+# Each nakshatra is ruled by a specific planet, Ashwini first
+_NAKSHATRA_LORDS = (
+    "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu",
+    "Jupiter", "Saturn", "Mercury", "Ketu", "Venus", "Sun",
+    "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury",
+    "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu",
+    "Jupiter", "Saturn", "Mercury"
+)
+
+
+@dataclass(frozen=True)
+class DashaTimeline:
+    """Mahadasha periods as parallel arrays, one entry per period in order."""
+    planets: Tuple[str, ...]
+    starts: np.ndarray  # datetime64[D]
+    ends: np.ndarray  # datetime64[D]
+    durations: np.ndarray  # whole years
+    active: int  # index of the active period; may fall past the kept periods
+
+    def to_list_of_dicts(self) -> List[Dict]:
+        """The list-of-dicts shape returned by ``calculate_dasha_timeline``."""
+        return [
+            {
+                "planet": planet,
+                "start_date": start,
+                "end_date": end,
+                "duration_years": years,
+                "is_active": i == self.active
+            }
+            for i, (planet, start, end, years) in enumerate(zip(
+                self.planets, self.starts.tolist(), self.ends.tolist(), self.durations.tolist()
+            ))
+        ]
 
-logger = logging.getLogger(__name__)
 
 class VedicDasha:
     """Main class for Vedic Dasha calculations."""
@@ -45,8 +85,9 @@ class VedicDasha:
         "Ketu": swe.MEAN_NODE
     }
 
-    def __init__(self, birth_date: date, birth_time: time, latitude: float, longitude: float, timezone: str = "Asia/Kolkata"):
-        """Initialize dasha calculation."""
+    def __init__(self, birth_date: date, birth_time: time, latitude: Optional[float] = None,
+                 longitude: Optional[float] = None, timezone: str = "Asia/Kolkata"):
+        """Initialize dasha calculation; location is only echoed back in the summary."""
         self.birth_date = birth_date
         self.birth_time = birth_time
         self.latitude = latitude
@@ -59,167 +100,138 @@ class VedicDasha:
             birth_time.hour + birth_time.minute/60.0 + birth_time.second/3600.0,
             swe.GREG_CAL
         )
-        
-        # Set ephemeris path
-        swe.set_ephe_path()
 
     def calculate_moon_nakshatra(self) -> Tuple[int, float]:
-        """Calculate moon's nakshatra at birth."""
-        try:
-            # Get moon position
-            moon_pos = swe.calc_ut(self.jd, swe.MOON, swe.FLG_SWIEPH)[0]
-            moon_longitude = moon_pos[0]
-            
-            # Calculate nakshatra (27 nakshatras, each 13.333 degrees)
-            nakshatra_num = int(moon_longitude / 13.333) + 1
-            nakshatra_degree = moon_longitude % 13.333
-            
-            return nakshatra_num, nakshatra_degree
-        except Exception as e:
-            logger.error(f"Error calculating moon nakshatra: {e}")
-            return 1, 0.0
+        """Calculate moon's nakshatra at birth; ``swisseph.Error`` propagates to the caller."""
+        return self._moon_nakshatra
+
+    @cached_property
+    def _moon_nakshatra(self) -> Tuple[int, float]:
+        # The birth moon is needed by the lord, the start date and every
+        # timeline/summary call; run swe.calc_ut once per instance.
+        # Get moon position
+        moon_pos = swe.calc_ut(self.jd, swe.MOON, swe.FLG_SWIEPH)[0]
+        moon_longitude = moon_pos[0]
+        
+        # Calculate nakshatra (27 nakshatras, each 13°20')
+        q, nakshatra_degree = divmod(moon_longitude % 360, _NAK)
+        nakshatra_num = int(q) + 1
+        
+        return nakshatra_num, nakshatra_degree
 
     def calculate_dasha_lord(self) -> str:
         """Calculate the dasha lord based on moon's nakshatra."""
         nakshatra_num, nakshatra_degree = self.calculate_moon_nakshatra()
-        
-        # Each nakshatra is ruled by a specific planet
-        nakshatra_lords = [
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu",
-            "Jupiter", "Saturn", "Mercury", "Ketu", "Venus", "Sun",
-            "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury",
-            "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu",
-            "Jupiter", "Saturn", "Mercury"
-        ]
-        
-        return nakshatra_lords[nakshatra_num - 1]
+        return _NAKSHATRA_LORDS[nakshatra_num - 1]
 
     def calculate_dasha_start_date(self, dasha_lord: str) -> date:
         """Calculate the start date of the current dasha."""
         nakshatra_num, nakshatra_degree = self.calculate_moon_nakshatra()
         
         # Calculate remaining period of current dasha
-        total_nakshatra_degrees = 13.333
+        total_nakshatra_degrees = _NAK
         remaining_degrees = total_nakshatra_degrees - nakshatra_degree
         
         # Calculate remaining time in current dasha
-        dasha_period_years = self.VIMSHOTTARI_PERIODS[dasha_lord]
+        dasha_period_years = _PLANETS[_DASHA_INDEX[dasha_lord]].years
         remaining_time_years = (remaining_degrees / total_nakshatra_degrees) * dasha_period_years
         
         # Calculate start date
-        start_date = self.birth_date + timedelta(days=remaining_time_years * 365.25)
+        # date + timedelta drops the fractional day anyway; add whole days
+        start_date = self.birth_date + timedelta(days=int(remaining_time_years * 365.25))
         
         return start_date
 
-    def calculate_dasha_timeline(self, years_ahead: int = 120) -> List[Dict]:
-        """Calculate complete dasha timeline."""
-        try:
-            # Get current dasha lord
-            current_dasha_lord = self.calculate_dasha_lord()
-            current_dasha_start = self.calculate_dasha_start_date(current_dasha_lord)
-            
-            timeline = []
-            current_date = current_dasha_start
-            
-            # Find current dasha lord in sequence
-            current_index = self.DASHA_SEQUENCE.index(current_dasha_lord)
-            
-            # Calculate dasha periods
-            for i in range(9):  # 9 planets in sequence
-                planet_index = (current_index + i) % 9
-                planet = self.DASHA_SEQUENCE[planet_index]
-                period_years = self.VIMSHOTTARI_PERIODS[planet]
-                
-                start_date = current_date
-                end_date = current_date + timedelta(days=period_years * 365.25)
-                
-                timeline.append({
-                    "planet": planet,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "duration_years": period_years,
-                    "is_active": i == 0
-                })
-                
-                current_date = end_date
-                
-                # Stop if we've covered enough years
-                if (end_date - self.birth_date).days > years_ahead * 365:
-                    break
-            
-            return timeline
-            
-        except Exception as e:
-            logger.error(f"Error calculating dasha timeline: {e}")
-            return []
+    def calculate_dasha_arrays(self, years_ahead: int = 120, at_date: Optional[date] = None) -> "DashaTimeline":
+        """Mahadasha timeline as parallel arrays; ``active`` is the period containing ``at_date`` (default today)."""
+        # Get current dasha lord
+        current_dasha_lord = self.calculate_dasha_lord()
+        current_dasha_start = self.calculate_dasha_start_date(current_dasha_lord)
+        
+        # Find current dasha lord in sequence
+        current_index = _DASHA_INDEX[current_dasha_lord]
+        cum_days = _DASHA_ROTATIONS_ARR[current_index]
+        active = _active_index(_DASHA_ROTATIONS[current_index], ((at_date or date.today()) - current_dasha_start).days)
+        
+        # Keep periods up to and including the first one ending past years_ahead
+        limit_days = years_ahead * 365 - (current_dasha_start - self.birth_date).days
+        n = min(int(np.searchsorted(cum_days, limit_days, side="right")) + 1, 9)
+        
+        order = _DASHA_ORDER[current_index, :n]
+        ends = np.datetime64(current_dasha_start, "D") + cum_days[:n]
+        starts = np.empty(n, dtype="datetime64[D]")
+        starts[0] = current_dasha_start
+        starts[1:] = ends[:-1]
+        
+        return DashaTimeline(
+            planets=tuple(_PLANETS[k].name for k in order.tolist()),
+            starts=starts,
+            ends=ends,
+            durations=_DASHA_YEARS_ARR[order],
+            active=active,
+        )
+
+    def calculate_dasha_timeline(self, years_ahead: int = 120, at_date: Optional[date] = None) -> List[Dict]:
+        """Calculate complete dasha timeline; ``is_active`` marks the period containing ``at_date`` (default today)."""
+        return self.calculate_dasha_arrays(years_ahead, at_date).to_list_of_dicts()
 
-    def calculate_antardasha_sequence(self, dasha_lord: str, start_date: date, end_date: date) -> List[Dict]:
+    def calculate_antardasha_sequence(self, dasha_lord: str, start_date: date, end_date: date,
+                                      at_date: Optional[date] = None) -> List[Dict]:
         """Calculate antardasha sequence for a given dasha period."""
-        try:
-            # Antardasha follows the same sequence as dasha
-            dasha_index = self.DASHA_SEQUENCE.index(dasha_lord)
-            dasha_period_days = (end_date - start_date).days
-            
-            antardasha_sequence = []
-            current_date = start_date
-            
-            for i in range(9):  # 9 planets in sequence
-                planet_index = (dasha_index + i) % 9
-                planet = self.DASHA_SEQUENCE[planet_index]
-                period_years = self.VIMSHOTTARI_PERIODS[planet]
-                
-                # Calculate antardasha period
-                antardasha_days = int((period_years / 120) * dasha_period_days)
-                antardasha_end = current_date + timedelta(days=antardasha_days)
-                
-                antardasha_sequence.append({
-                    "planet": planet,
-                    "start_date": current_date,
-                    "end_date": antardasha_end,
-                    "duration_days": antardasha_days,
-                    "is_active": i == 0
-                })
-                
-                current_date = antardasha_end
-            
-            return antardasha_sequence
-            
-        except Exception as e:
-            logger.error(f"Error calculating antardasha sequence: {e}")
-            return []
-
-    def get_current_dasha(self) -> Dict:
-        """Get current active dasha and antardasha."""
-        try:
-            timeline = self.calculate_dasha_timeline()
-            if not timeline:
-                return {"error": "Could not calculate dasha timeline"}
-            
-            current_dasha = timeline[0]  # First one is current
-            
-            # Calculate current antardasha
-            antardasha_sequence = self.calculate_antardasha_sequence(
-                current_dasha["planet"],
-                current_dasha["start_date"],
-                current_dasha["end_date"]
-            )
-            
-            current_antardasha = antardasha_sequence[0] if antardasha_sequence else None
+        # Antardasha follows the same sequence as dasha
+        dasha_index = _DASHA_INDEX[dasha_lord]
+        dasha_period_days = (end_date - start_date).days
+        days = [int(_PLANETS[(dasha_index + i) % 9].fraction * dasha_period_days) for i in range(9)]
+        active = _active_index(tuple(accumulate(days)), ((at_date or date.today()) - start_date).days)
+        
+        antardasha_sequence = []
+        current_date = start_date
+        
+        for i in range(9):  # 9 planets in sequence
+            antardasha_days = days[i]
+            antardasha_end = current_date + timedelta(days=antardasha_days)
             
-            return {
-                "current_dasha": current_dasha,
-                "current_antardasha": current_antardasha,
-                "calculated_at": datetime.now().isoformat()
-            }
+            antardasha_sequence.append({
+                "planet": _PLANETS[(dasha_index + i) % 9].name,
+                "start_date": current_date,
+                "end_date": antardasha_end,
+                "duration_days": antardasha_days,
+                "is_active": i == active
+            })
             
-        except Exception as e:
-            logger.error(f"Error getting current dasha: {e}")
-            return {"error": f"Could not calculate current dasha: {e}"}
+            current_date = antardasha_end
+        
+        return antardasha_sequence
+
+    def get_current_dasha(self, at_date: Optional[date] = None) -> Dict:
+        """Get the dasha and antardasha active on ``at_date`` (default today)."""
+        return self._current_from_timeline(self.calculate_dasha_timeline(at_date=at_date), at_date)
+
+    def _current_from_timeline(self, timeline: List[Dict], at_date: Optional[date] = None) -> Dict:
+        """Current dasha/antardasha from an already computed timeline."""
+        current_dasha = next((d for d in timeline if d["is_active"]), timeline[0])
+        
+        # Calculate current antardasha
+        antardasha_sequence = self.calculate_antardasha_sequence(
+            current_dasha["planet"],
+            current_dasha["start_date"],
+            current_dasha["end_date"],
+            at_date
+        )
+        
+        current_antardasha = next((a for a in antardasha_sequence if a["is_active"]),
+                                  antardasha_sequence[0] if antardasha_sequence else None)
+        
+        return {
+            "current_dasha": current_dasha,
+            "current_antardasha": current_antardasha,
+            "calculated_at": datetime.now().isoformat()
+        }
 
     def get_dasha_summary(self) -> Dict:
         """Get complete dasha summary."""
         timeline = self.calculate_dasha_timeline()
-        current_info = self.get_current_dasha()
+        current_info = self._current_from_timeline(timeline)
         
         return {
             "birth_data": {
@@ -234,3 +246,91 @@ class VedicDasha:
             "current_antardasha": current_info.get("current_antardasha"),
             "calculated_at": datetime.now().isoformat()
         }
+
+
+class _Planet(NamedTuple):
+    name: str
+    years: int
+    days: float  # years * 365.25
+    fraction: float  # share of the 120-year cycle
+
+
+# Vimshottari tables aligned to DASHA_SEQUENCE, built once at import
+_PLANETS = tuple(
+    _Planet(p, y, y * 365.25, y / 120)
+    for p, y in ((p, VedicDasha.VIMSHOTTARI_PERIODS[p]) for p in VedicDasha.DASHA_SEQUENCE)
+)
+_DASHA_INDEX = {p: i for i, p in enumerate(VedicDasha.DASHA_SEQUENCE)}
+# Whole cumulative days for the sequence starting at each lord; flooring
+# matches what date + timedelta(days=float) yields, minus the float timedelta
+_DASHA_ROTATIONS = tuple(
+    tuple(int(c) for c in accumulate(_PLANETS[(k + i) % 9].days for i in range(9))) for k in range(9)
+)
+_DASHA_ROTATIONS_ARR = np.array(_DASHA_ROTATIONS, dtype=np.int64)
+# Lord indices for the sequence starting at each lord
+_DASHA_ORDER = (np.arange(9)[:, None] + np.arange(9)) % 9
+_DASHA_YEARS_ARR = np.array([p.years for p in _PLANETS], dtype=np.int64)
+
+
+def _active_index(cum_days, elapsed_days: float) -> int:
+    """Index of the period containing ``elapsed_days``, clamped to the sequence."""
+    return min(max(bisect_right(cum_days, elapsed_days), 0), len(cum_days) - 1)
+
+
+_DASHA_FRACTIONS_ARR = np.array([p.fraction for p in _PLANETS], dtype=np.float64)
+
+
+@lazy_njit(cache=True, parallel=True)
+def _dasha_kernel(lords, start_days, rotations, fractions):
+    """
+    Maha + antardasha periods for a batch of births as day numbers.
+    
+    Row n holds 81 periods, antardashas of each Mahadasha in order, split
+    the same way as calculate_antardasha_sequence. Plain loops and
+    math.floor only, so it compiles under numba.njit.
+    """
+    n = lords.shape[0]
+    planets = np.empty((n, 81), dtype=np.int8)
+    starts = np.empty((n, 81), dtype=np.int64)
+    ends = np.empty((n, 81), dtype=np.int64)
+    for b in prange(n):
+        lord = lords[b]
+        maha_start = start_days[b]
+        for i in range(9):
+            maha_end = start_days[b] + rotations[lord, i]
+            period_days = maha_end - maha_start
+            k = (lord + i) % 9
+            current = maha_start
+            for j in range(9):
+                kk = (k + j) % 9
+                days = math.floor(fractions[kk] * period_days)
+                planets[b, i * 9 + j] = kk
+                starts[b, i * 9 + j] = current
+                ends[b, i * 9 + j] = current + days
+                current += days
+            maha_start = maha_end
+    return planets, starts, ends
+
+
+def compute_dasha_periods(dashas: Sequence[VedicDasha]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    All 81 Maha/antardasha periods for many births at once.
+    
+    Returns:
+        Tuple of (planets, starts, ends), each shaped (N, 81). planets are
+        indices into DASHA_SEQUENCE; starts/ends are datetime64[D].
+    
+    The birth moon is still one swe.calc_ut per instance; the period
+    arithmetic runs in the numba-compiled kernel when numba is installed
+    (compiled on the first call).
+    """
+    lords = np.empty(len(dashas), dtype=np.int64)
+    start_days = np.empty(len(dashas), dtype="datetime64[D]")
+    for i, dasha in enumerate(dashas):
+        lord = dasha.calculate_dasha_lord()
+        lords[i] = _DASHA_INDEX[lord]
+        start_days[i] = dasha.calculate_dasha_start_date(lord)
+    planets, starts, ends = _dasha_kernel(
+        lords, start_days.astype(np.int64), _DASHA_ROTATIONS_ARR, _DASHA_FRACTIONS_ARR
+    )
+    return planets, starts.astype("datetime64[D]"), ends.astype("datetime64[D]")
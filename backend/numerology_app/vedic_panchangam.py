@@ -3,46 +3,82 @@ Vedic Panchangam calculations using pyswisseph (Swiss Ephemeris).
 Based on proven formulas for accurate Tithi, Nakshatra, Yoga, and Karana calculations.
 """
 
-import swisseph as swe
+from .ephe import swe
 import math
 from datetime import datetime, date, timedelta
-from typing import Dict, Any, Optional
-import pytz
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+import numpy as np
 
 
-class Tithi:
+_NAK = 360.0 / 27.0  # exact nakshatra/yoga span, 13°20'
+
+
+@lru_cache(maxsize=4096)
+def _sun_moon_long(jd_rounded: float) -> tuple:
+    """(sun, moon) ecliptic longitudes; callers round ``jd`` to 1e-4 days (~8.6 s) so nearby requests share entries."""
+    return (
+        swe.calc_ut(jd_rounded, swe.SUN, swe.FLG_SWIEPH)[0][0],
+        swe.calc_ut(jd_rounded, swe.MOON, swe.FLG_SWIEPH)[0][0],
+    )
+
+
+@lru_cache(maxsize=8192)
+def _sun_rise_set(jd: float, lat_q: float, lon_q: float) -> tuple:
+    """(sunrise_jd, sunset_jd) after ``jd``; callers round lat/lon to 3 decimals (~100 m)."""
+    geopos = (lon_q, lat_q, 0.0)
+    rise = swe.rise_trans(jd, swe.SUN, swe.CALC_RISE, geopos, 0.0, 0.0, swe.FLG_SWIEPH)[1][0]
+    set_ = swe.rise_trans(jd, swe.SUN, swe.CALC_SET, geopos, 0.0, 0.0, swe.FLG_SWIEPH)[1][0]
+    return rise, set_
+
+
+def _day_jd(date_obj: date) -> float:
+    """
+    Julian day at which a date's elements are sampled: 01:00 UT.
+
+    Historically ``swe.julday(y, m, d, swe.GREG_CAL)`` passed GREG_CAL (1)
+    as the hour; the hour is now explicit and every path goes through here.
+    """
+    return swe.julday(date_obj.year, date_obj.month, date_obj.day, 1.0, swe.GREG_CAL)
+
+
+def _jd_to_dt(jd: float) -> datetime:
+    """UT datetime (to the second) for a julian day."""
+    y, m, d, hf = swe.revjul(jd, swe.GREG_CAL)
+    mm, ss = divmod(int(hf * 3600), 60)
+    hh, mm = divmod(mm, 60)
+    return datetime(y, m, d, hh, mm, ss)
+
+
+class Tithi(NamedTuple):
     """Represents a Tithi (lunar day) with its properties."""
-    def __init__(self, index: int, name_english: str, elapsed_percentage: float, end_time: Optional[datetime] = None):
-        self.index = index
-        self.name_english = name_english
-        self.elapsed_percentage = elapsed_percentage
-        self.end_time = end_time
+    index: int
+    name_english: str
+    elapsed_percentage: float
+    end_time: Optional[datetime] = None
 
 
-class Nakshatra:
+class Nakshatra(NamedTuple):
     """Represents a Nakshatra (lunar mansion) with its properties."""
-    def __init__(self, index: int, name_english: str, elapsed_percentage: float, end_time: Optional[datetime] = None):
-        self.index = index
-        self.name_english = name_english
-        self.elapsed_percentage = elapsed_percentage
-        self.end_time = end_time
+    index: int
+    name_english: str
+    elapsed_percentage: float
+    end_time: Optional[datetime] = None
 
 
-class Yoga:
+class Yoga(NamedTuple):
     """Represents a Yoga with its properties."""
-    def __init__(self, index: int, name_english: str, elapsed_percentage: float, end_time: Optional[datetime] = None):
-        self.index = index
-        self.name_english = name_english
-        self.elapsed_percentage = elapsed_percentage
-        self.end_time = end_time
+    index: int
+    name_english: str
+    elapsed_percentage: float
+    end_time: Optional[datetime] = None
 
 
-class Karana:
+class Karana(NamedTuple):
     """Represents a Karana with its properties."""
-    def __init__(self, name_english: str, elapsed_percentage: float, end_time: Optional[datetime] = None):
-        self.name_english = name_english
-        self.elapsed_percentage = elapsed_percentage
-        self.end_time = end_time
+    name_english: str
+    elapsed_percentage: float
+    end_time: Optional[datetime] = None
 
 
 class City:
@@ -106,18 +142,23 @@ class Panchangam:
 
     def compute(self):
         """Compute all panchangam elements for the given date and location."""
-        # Set ephemeris path (use default)
-        swe.set_ephe_path()
-        
+        # Deterministic in (location, date); share results across instances
+        (self.tithi, self.nakshatra, self.yoga, self.karana,
+         self.sunrise, self.sunset) = compute_panchangam(
+            round(self.city.latitude, 3), round(self.city.longitude, 3),
+            (self.date_obj.year, self.date_obj.month, self.date_obj.day),
+        )
+
+    def _compute(self):
+        """Uncached body of :meth:`compute`."""
         # Convert date to Julian day number
-        jd = swe.julday(self.date_obj.year, self.date_obj.month, self.date_obj.day, swe.GREG_CAL)
+        jd = _day_jd(self.date_obj)
         
         # Calculate sunrise and sunset
         self._calculate_sunrise_sunset(jd)
         
         # Calculate sun and moon positions
-        sun_long = self._get_sun_longitude(jd)
-        moon_long = self._get_moon_longitude(jd)
+        sun_long, moon_long = _sun_moon_long(round(jd, 4))
         
         # Calculate panchangam elements
         self._calculate_tithi(sun_long, moon_long, jd)
@@ -125,78 +166,101 @@ class Panchangam:
         self._calculate_yoga(sun_long, moon_long, jd)
         self._calculate_karana(jd)
 
+    @classmethod
+    def compute_range(cls, city: City, start: date, n_days: int) -> List[Dict[str, Any]]:
+        """
+        Tithi/Nakshatra/Yoga/Karana for ``n_days`` consecutive dates from ``start``.
+
+        Same sampling time (see _day_jd) and longitudes as :meth:`compute`, but
+        the element arithmetic runs once over NumPy arrays instead of per date.
+        Sunrise/sunset are not included.
+        """
+        dates = [start + timedelta(days=i) for i in range(n_days)]
+        # Same rounded JDs as the scalar path, so the two share _sun_moon_long entries
+        sun_moon = np.array([_sun_moon_long(round(_day_jd(d), 4)) for d in dates]).reshape(n_days, 2)
+        sun_long, moon_long = sun_moon[:, 0], sun_moon[:, 1]
+
+        tithi_q, tithi_r = np.divmod((moon_long - sun_long) % 360, 12.0)
+        tithi_idx = tithi_q.astype(np.intp)
+        tithi_progress = tithi_r / 12.0
+        nak_idx = np.divmod(moon_long % 360, _NAK)[0].astype(np.intp)
+        yoga_idx = np.divmod((sun_long + moon_long) % 360, _NAK)[0].astype(np.intp)
+        karana_idx = (tithi_idx * 2 + (tithi_progress >= 0.5)) % 11
+
+        tithi_names = _TITHI_FULL_NAMES_ARR[tithi_idx]
+        nak_names = np.asarray(cls.NAKSHATRA_NAMES, dtype=object)[nak_idx]
+        yoga_names = np.asarray(cls.YOGA_NAMES, dtype=object)[yoga_idx]
+        karana_names = np.asarray(cls.KARANA_NAMES, dtype=object)[karana_idx]
+
+        return [
+            {
+                "date": d,
+                "tithi": t + 1,
+                "tithi_name": tn,
+                "nakshatra": n + 1,
+                "nakshatra_name": nn,
+                "yoga": y + 1,
+                "yoga_name": yn,
+                "karana_name": kn,
+            }
+            for d, t, tn, n, nn, y, yn, kn in zip(
+                dates, tithi_idx.tolist(), tithi_names.tolist(), nak_idx.tolist(), nak_names.tolist(),
+                yoga_idx.tolist(), yoga_names.tolist(), karana_names.tolist(),
+            )
+        ]
+
     def _calculate_sunrise_sunset(self, jd: float):
         """Calculate sunrise and sunset times."""
-        # Get timezone offset
-        tz = pytz.timezone(self.city.timezone)
-        utc_offset = tz.utcoffset(datetime.now()).total_seconds() / 3600
-        
-        # Calculate sunrise and sunset
-        sunrise_jd = swe.rise_trans(jd, swe.SUN, "", swe.CALC_RISE, 
-                                   swe.FLG_SWIEPH, self.city.longitude, self.city.latitude, 0, 0, 0)[1][0]
-        sunset_jd = swe.rise_trans(jd, swe.SUN, "", swe.CALC_SET, 
-                                  swe.FLG_SWIEPH, self.city.longitude, self.city.latitude, 0, 0, 0)[1][0]
+        # Shared across instances: a monthly calendar for one city reuses these
+        sunrise_jd, sunset_jd = _sun_rise_set(
+            jd, round(self.city.latitude, 3), round(self.city.longitude, 3)
+        )
         
         # Convert to datetime
         if sunrise_jd > 0:
-            self.sunrise = swe.revjul(sunrise_jd, swe.GREG_CAL)
-            self.sunrise = datetime(*[int(x) for x in self.sunrise[:6]])
+            self.sunrise = _jd_to_dt(sunrise_jd)
         else:
             self.sunrise = datetime(self.date_obj.year, self.date_obj.month, self.date_obj.day, 6, 0)
             
         if sunset_jd > 0:
-            self.sunset = swe.revjul(sunset_jd, swe.GREG_CAL)
-            self.sunset = datetime(*[int(x) for x in self.sunset[:6]])
+            self.sunset = _jd_to_dt(sunset_jd)
         else:
             self.sunset = datetime(self.date_obj.year, self.date_obj.month, self.date_obj.day, 18, 0)
 
-    def _get_sun_longitude(self, jd: float) -> float:
-        """Get sun's longitude."""
-        sun_pos = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)[0]
-        return sun_pos[0]  # Longitude in degrees
-
-    def _get_moon_longitude(self, jd: float) -> float:
-        """Get moon's longitude."""
-        moon_pos = swe.calc_ut(jd, swe.MOON, swe.FLG_SWIEPH)[0]
-        return moon_pos[0]  # Longitude in degrees
-
     def _calculate_tithi(self, sun_long: float, moon_long: float, jd: float):
         """Calculate Tithi (lunar day)."""
         # Tithi is the angular distance between sun and moon divided by 12 degrees
-        tithi_diff = (moon_long - sun_long) % 360
-        tithi_num = int(tithi_diff / 12) + 1
+        q, r = divmod((moon_long - sun_long) % 360, 12.0)
+        tithi_num = int(q) + 1
         
         # Calculate progress within the tithi
-        tithi_progress = (tithi_diff % 12) / 12.0
+        tithi_progress = r / 12.0
         
-        # Determine if it's Shukla or Krishna paksha
-        if tithi_num <= 15:
-            tithi_name = f"Shukla {self.TITHI_NAMES[tithi_num - 1]}"
-        else:
-            tithi_name = f"Krishna {self.TITHI_NAMES[tithi_num - 16]}"
+        # Shukla paksha for 1..15, Krishna for 16..30
+        tithi_name = _TITHI_FULL_NAMES[tithi_num - 1]
         
         self.tithi = Tithi(tithi_num, tithi_name, tithi_progress)
 
     def _calculate_nakshatra(self, moon_long: float, jd: float):
         """Calculate Nakshatra (lunar mansion)."""
-        # Nakshatra is moon's longitude divided by 13.333 degrees (360/27)
-        nakshatra_diff = (moon_long - 0) % 360  # Start from Ashwini
-        nakshatra_num = int(nakshatra_diff / 13.333) + 1
+        # Nakshatra is moon's longitude divided by 13°20' (360/27)
+        q, r = divmod(moon_long % 360, _NAK)  # Start from Ashwini
+        nakshatra_num = int(q) + 1
         
         # Calculate progress within the nakshatra
-        nakshatra_progress = (nakshatra_diff % 13.333) / 13.333
+        nakshatra_progress = r / _NAK
         
         nakshatra_name = self.NAKSHATRA_NAMES[nakshatra_num - 1]
         self.nakshatra = Nakshatra(nakshatra_num, nakshatra_name, nakshatra_progress)
 
     def _calculate_yoga(self, sun_long: float, moon_long: float, jd: float):
         """Calculate Yoga."""
-        # Yoga is the sum of sun and moon longitudes divided by 13.333 degrees
-        yoga_sum = (sun_long + moon_long) % 360
-        yoga_num = int(yoga_sum / 13.333) + 1
+        # Yoga is the sum of sun and moon longitudes divided by 13°20'
+        q, r = divmod((sun_long + moon_long) % 360, _NAK)
+        yoga_num = int(q) + 1
         
         # Calculate progress within the yoga
-        yoga_progress = (yoga_sum % 13.333) / 13.333
+        yoga_progress = r / _NAK
         
         yoga_name = self.YOGA_NAMES[yoga_num - 1]
         self.yoga = Yoga(yoga_num, yoga_name, yoga_progress)
@@ -221,3 +285,24 @@ class Panchangam:
             karana_progress = (tithi_progress * 2) % 1.0
             
             self.karana = Karana(karana_name, karana_progress)
+
+
+# "Shukla <name>" / "Krishna <name>" for tithi 1..30; a tuple for the
+# scalar path, an object array for fancy indexing in compute_range
+_TITHI_FULL_NAMES = tuple(
+    ("Shukla " if i < 15 else "Krishna ") + n for i, n in enumerate(Panchangam.TITHI_NAMES)
+)
+_TITHI_FULL_NAMES_ARR = np.array(_TITHI_FULL_NAMES, dtype=object)
+
+
+@lru_cache(maxsize=4096)
+def compute_panchangam(lat: float, lon: float, ymd: Tuple[int, int, int]) -> tuple:
+    """
+    (tithi, nakshatra, yoga, karana, sunrise, sunset) for a date and location.
+
+    Callers round lat/lon to 3 decimals (~100 m) so nearby requests share
+    entries. Every value is immutable, so cached results are safe to hand out.
+    """
+    panch = Panchangam(City("", lat, lon, ""), date(*ymd))
+    panch._compute()
+    return panch.tithi, panch.nakshatra, panch.yoga, panch.karana, panch.sunrise, panch.sunset
@@ -24,16 +24,22 @@ def run_command(cmd, description):
     print(f"{'='*60}")
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=False)
-        print(f"✅ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed with exit code {e.returncode}")
-        return False
-    except FileNotFoundError:
+        if cmd[1:3] == ["-m", "pytest"]:
+            # Same interpreter: skip a cold start and plugin discovery per run
+            import pytest
+            returncode = int(pytest.main(cmd[3:]))
+        else:
+            returncode = subprocess.run(cmd, capture_output=False).returncode
+    except (FileNotFoundError, ImportError):
         print(f"❌ Command not found: {cmd[0]}")
-        print("Make sure pytest is installed: pip install pytest pytest-cov")
+        print("Make sure pytest is installed: pip install pytest pytest-cov pytest-xdist")
+        return False
+    
+    if returncode != 0:
+        print(f"❌ {description} failed with exit code {returncode}")
         return False
+    print(f"✅ {description} completed successfully")
+    return True
 
 
 def run_unit_tests():
@@ -70,18 +76,26 @@ def run_health_tests():
     return run_command(cmd, "Health Endpoint Tests")
 
 
-def run_all_tests():
+def parallel_args(serial=False):
+    """pytest-xdist arguments: one worker per CPU, each test file kept on one worker."""
+    if serial:
+        return []
+    return ["-n", "auto", "--dist=loadfile"]
+
+
+def run_all_tests(serial=False):
     """Run all tests."""
     cmd = [
         sys.executable, "-m", "pytest",
         "tests/",
         "-v",
-        "--tb=short"
+        "--tb=short",
+        *parallel_args(serial)
     ]
     return run_command(cmd, "All Tests")
 
 
-def run_tests_with_coverage():
+def run_tests_with_coverage(serial=False):
     """Run tests with coverage report."""
     cmd = [
         sys.executable, "-m", "pytest",
@@ -90,7 +104,9 @@ def run_tests_with_coverage():
         "--cov-report=html",
         "--cov-report=term-missing",
         "--cov-fail-under=80",
-        "-v"
+        "--cov-context=test",
+        "-v",
+        *parallel_args(serial)
     ]
     return run_command(cmd, "Tests with Coverage")
 
@@ -133,6 +149,11 @@ def main():
         "--test-path",
         help="Specific test path (required for 'specific' test type)"
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run 'all' and 'coverage' in a single process (no pytest-xdist)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -158,9 +179,9 @@ def main():
     elif args.test_type == "health":
         success = run_health_tests()
     elif args.test_type == "all":
-        success = run_all_tests()
+        success = run_all_tests(args.serial)
     elif args.test_type == "coverage":
-        success = run_tests_with_coverage()
+        success = run_tests_with_coverage(args.serial)
     elif args.test_type == "fast":
         success = run_fast_tests()
     elif args.test_type == "specific":
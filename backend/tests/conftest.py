@@ -0,0 +1,55 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Async tests run on uvloop when it is available (uvicorn[standard] ships it
+# on non-Windows platforms); otherwise the stock asyncio loop is used.
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover
+        uvloop = None
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+async def app_without_lifespan(scope, receive, send):
+    """The API app with startup/shutdown acknowledged but not run; HTTP tests don't need the DB or jobs."""
+    from numerology_app.main import app
+
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    await app(scope, receive, send)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient, and one portal, shared by every test in the session."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_without_lifespan) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def ephemeris():
+    """The Skyfield kernels and timescale, loaded once before the first test that needs them."""
+    from numerology_app.panchangam.astronomy import _get_ts, astronomy_engine, get_ephemeris
+
+    _get_ts()
+    astronomy_engine.eph  # AstronomyEngine's own kernel (EPH_FILE)
+    return get_ephemeris()  # EPH_PATH, used by the panchangam longitude/sun-event helpers
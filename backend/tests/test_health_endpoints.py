@@ -5,8 +5,9 @@ This module contains tests for the health check endpoints to ensure
 they return the correct status and format.
 """
 
+import asyncio
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 import sys
 import os
 
@@ -15,26 +16,25 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from numerology_app.main import app
 
+HEALTH_ENDPOINTS = ["/healthz", "/api/healthz"]
+LOAD_TIMEOUT = 2.0  # seconds; per-request budget in the load test
+
 
 class TestHealthEndpoints:
     """Test cases for health check endpoints."""
     
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-    
-    def test_root_healthz_endpoint(self):
+    def test_root_healthz_endpoint(self, client):
         """Test the root /healthz endpoint."""
-        response = self.client.get("/healthz")
+        response = client.get("/healthz")
         
         assert response.status_code == 200
         data = response.json()
         assert "ok" in data
         assert data["ok"] is True
     
-    def test_api_healthz_endpoint(self):
+    def test_api_healthz_endpoint(self, client):
         """Test the /api/healthz endpoint."""
-        response = self.client.get("/api/healthz")
+        response = client.get("/api/healthz")
         
         assert response.status_code == 200
         data = response.json()
@@ -45,158 +45,147 @@ class TestHealthEndpoints:
         assert "service" in data
         assert data["service"] == "numerology-api"
     
-    def test_health_endpoints_response_format(self):
+    @pytest.mark.parametrize("endpoint", HEALTH_ENDPOINTS)
+    def test_health_endpoints_response_format(self, client, endpoint):
         """Test that health endpoints return the correct format."""
-        endpoints = ["/healthz", "/api/healthz"]
+        response = client.get(endpoint)
+        assert response.status_code == 200
         
-        for endpoint in endpoints:
-            response = self.client.get(endpoint)
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert isinstance(data, dict)
-            assert "ok" in data
-            assert isinstance(data["ok"], bool)
-            assert data["ok"] is True
+        data = response.json()
+        assert isinstance(data, dict)
+        assert "ok" in data
+        assert isinstance(data["ok"], bool)
+        assert data["ok"] is True
     
-    def test_health_endpoints_are_fast(self):
+    @pytest.mark.parametrize("endpoint", HEALTH_ENDPOINTS)
+    def test_health_endpoints_are_fast(self, client, endpoint, benchmark):
         """Test that health endpoints respond quickly."""
-        import time
+        benchmark.group = endpoint
+        benchmark.extra_info["threshold"] = 1.0
         
-        endpoints = ["/healthz", "/api/healthz"]
+        response = benchmark.pedantic(client.get, args=(endpoint,), iterations=50, rounds=20, warmup_rounds=5)
         
-        for endpoint in endpoints:
-            start_time = time.time()
-            response = self.client.get(endpoint)
-            end_time = time.time()
-            
-            response_time = end_time - start_time
-            
-            assert response.status_code == 200
-            assert response_time < 1.0, f"Health endpoint {endpoint} took {response_time:.3f} seconds"
+        assert response.status_code == 200
+        # No stats when benchmarking is disabled (e.g. under xdist)
+        if benchmark.stats is not None:
+            median = benchmark.stats.stats.median
+            assert median < 1.0, f"Health endpoint {endpoint} took {median:.3f} seconds"
     
-    def test_health_endpoints_with_different_methods(self):
+    @pytest.mark.parametrize("endpoint", HEALTH_ENDPOINTS)
+    def test_health_endpoints_with_different_methods(self, client, endpoint):
         """Test that health endpoints only accept GET requests."""
-        endpoints = ["/healthz", "/api/healthz"]
+        # GET should work
+        response = client.get(endpoint)
+        assert response.status_code == 200
         
-        for endpoint in endpoints:
-            # GET should work
-            response = self.client.get(endpoint)
-            assert response.status_code == 200
-            
-            # POST should not work
-            response = self.client.post(endpoint)
-            assert response.status_code == 405  # Method Not Allowed
-            
-            # PUT should not work
-            response = self.client.put(endpoint)
-            assert response.status_code == 405  # Method Not Allowed
-            
-            # DELETE should not work
-            response = self.client.delete(endpoint)
-            assert response.status_code == 405  # Method Not Allowed
+        # POST should not work
+        response = client.post(endpoint)
+        assert response.status_code == 405  # Method Not Allowed
+        
+        # PUT should not work
+        response = client.put(endpoint)
+        assert response.status_code == 405  # Method Not Allowed
+        
+        # DELETE should not work
+        response = client.delete(endpoint)
+        assert response.status_code == 405  # Method Not Allowed
     
-    def test_health_endpoints_headers(self):
+    @pytest.mark.parametrize("endpoint", HEALTH_ENDPOINTS)
+    def test_health_endpoints_headers(self, client, endpoint):
         """Test that health endpoints return appropriate headers."""
-        endpoints = ["/healthz", "/api/healthz"]
+        response = client.get(endpoint)
+        assert response.status_code == 200
         
-        for endpoint in endpoints:
-            response = self.client.get(endpoint)
-            assert response.status_code == 200
-            
-            # Should have content-type header
-            assert "content-type" in response.headers
-            assert "application/json" in response.headers["content-type"]
+        # Should have content-type header
+        assert "content-type" in response.headers
+        assert "application/json" in response.headers["content-type"]
+    
+    @pytest.mark.parametrize("endpoint", HEALTH_ENDPOINTS)
+    def test_health_endpoints_cors(self, client, endpoint):
+        """Test that cross-origin health checks get CORS headers and preflights succeed."""
+        origin = {"Origin": "http://localhost:5173"}
+        
+        response = client.get(endpoint, headers=origin)
+        assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
+        
+        preflight = client.options(endpoint, headers={**origin, "Access-Control-Request-Method": "GET"})
+        assert preflight.status_code == 200
+        assert "access-control-allow-origin" in preflight.headers
     
-    def test_health_endpoints_consistency(self):
+    @pytest.mark.parametrize("endpoint", HEALTH_ENDPOINTS)
+    def test_health_endpoints_consistency(self, client, endpoint):
         """Test that health endpoints return consistent responses."""
-        endpoints = ["/healthz", "/api/healthz"]
-        
-        # Make multiple requests to ensure consistency
-        for endpoint in endpoints:
-            responses = []
-            for _ in range(5):
-                response = self.client.get(endpoint)
-                assert response.status_code == 200
-                responses.append(response.json())
-            
-            # All responses should be identical
-            first_response = responses[0]
-            for response in responses[1:]:
-                assert response == first_response
+        responses = []
+        for _ in range(5):
+            response = client.get(endpoint)
+            assert response.status_code == 200
+            responses.append(response.json())
+        
+        # All responses should be identical
+        first_response = responses[0]
+        for response in responses[1:]:
+            assert response == first_response
 
 
 class TestHealthEndpointIntegration:
     """Integration tests for health endpoints."""
     
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-    
-    def test_health_endpoints_with_other_endpoints(self):
+    def test_health_endpoints_with_other_endpoints(self, client):
         """Test that health endpoints work alongside other endpoints."""
         # Test health endpoints
-        health_response = self.client.get("/healthz")
+        health_response = client.get("/healthz")
         assert health_response.status_code == 200
         
-        api_health_response = self.client.get("/api/healthz")
+        api_health_response = client.get("/api/healthz")
         assert api_health_response.status_code == 200
         
-        # Test that other endpoints still work
-        # (This assumes there are other endpoints available)
-        try:
-            # Try to access the root endpoint
-            root_response = self.client.get("/")
-            # Root endpoint might not exist, so we just check it doesn't crash
-            assert root_response.status_code in [200, 404]
-        except Exception:
-            # It's okay if the root endpoint doesn't exist
-            pass
+        # Requests outside the health paths still reach the app. HEAD skips
+        # the body; the root route may be absent or GET-only.
+        root_response = client.head("/")
+        assert root_response.status_code in {200, 404, 405}
     
-    def test_health_endpoints_under_load(self):
+    @pytest.mark.asyncio
+    async def test_health_endpoints_under_load(self):
         """Test health endpoints under simulated load."""
-        import concurrent.futures
-        import time
-        
-        def make_health_request(endpoint):
-            """Make a health request and return the response time."""
-            start_time = time.time()
-            response = self.client.get(endpoint)
-            end_time = time.time()
-            
-            return {
-                "status_code": response.status_code,
-                "response_time": end_time - start_time,
-                "data": response.json()
-            }
-        
-        endpoints = ["/healthz", "/api/healthz"]
-        
-        # Make concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for _ in range(20):  # 20 concurrent requests
-                for endpoint in endpoints:
-                    future = executor.submit(make_health_request, endpoint)
-                    futures.append(future)
+        loop = asyncio.get_running_loop()
+        
+        # One client and one transport for all 40 requests; a stalled request
+        # fails with a timeout instead of hanging the gather
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+            timeout=httpx.Timeout(LOAD_TIMEOUT),
+        ) as ac:
+            async def make_health_request(endpoint):
+                """Make a health request and return the response time."""
+                start_time = loop.time()
+                response = await ac.get(endpoint)
+                end_time = loop.time()
+                
+                return {
+                    "status_code": response.status_code,
+                    "http_version": response.http_version,
+                    "response_time": end_time - start_time,
+                    "data": response.json()
+                }
             
-            # Collect results
-            results = []
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                results.append(result)
+            # 40 concurrent requests on one event loop
+            results = await asyncio.gather(
+                *[make_health_request(endpoint) for _ in range(20) for endpoint in HEALTH_ENDPOINTS]
+            )
         
         # All requests should succeed
         for result in results:
             assert result["status_code"] == 200
+            assert result["http_version"] == "HTTP/1.1"
             assert result["data"]["ok"] is True
-            assert result["response_time"] < 2.0  # Should respond within 2 seconds
+            assert result["response_time"] < LOAD_TIMEOUT
         
         # Calculate average response time
         avg_response_time = sum(r["response_time"] for r in results) / len(results)
         assert avg_response_time < 1.0, f"Average response time: {avg_response_time:.3f} seconds"
 
-
 if __name__ == "__main__":
     # Run tests if executed directly
     pytest.main([__file__, "-v"])
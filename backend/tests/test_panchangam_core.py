@@ -5,6 +5,7 @@ This module contains sanity tests for panchangam calculations including
 tithi, nakshatra, yoga, karana, and timing calculations.
 """
 
+import numpy as np
 import pytest
 from datetime import date, datetime, timedelta
 from typing import Dict, Any
@@ -17,91 +18,110 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from numerology_app.panchangam.core import (
     compute_tithi, compute_nakshatra, compute_yoga, compute_karana,
     compute_rahu_yama_gulikai, compute_hora, compute_gowri_nalla,
-    assemble_panchangam
+    assemble_panchangam, KARANAS,
+    compute_tithi_vec, compute_nakshatra_vec, compute_yoga_vec, compute_karana_vec
 )
 from numerology_app.panchangam.astronomy import (
-    get_sun_longitude, get_moon_longitude, get_sunrise_sunset
+    get_sun_longitude, get_moon_longitude, get_sunrise_sunset, get_year_sun_events,
+    fast_sunrise_sunset, fast_sunrise_sunset_batch
 )
 
+# Parse the ephemeris once per session, not inside whichever test runs first
+pytestmark = pytest.mark.usefixtures("ephemeris")
+
+_VALID_PLANETS = frozenset({"Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"})
+_REGULAR_KARANAS = frozenset({"Bava", "Balava", "Kaulava", "Taitila", "Garija", "Vanija", "Vishti"})
+_SPECIAL_KARANAS_T1 = frozenset({"Chatushpada", "Naga"})
+_SPECIAL_KARANAS_T2 = frozenset({"Naga", "Kimstughna"})
+
+
+@pytest.fixture(scope="module")
+def panchangam_jan2024():
+    """Chennai panchangams for January 2024, computed once per module."""
+    lat, lon, tz = 13.0827, 80.2707, "Asia/Kolkata"
+    dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(30)]
+    return {d: assemble_panchangam(d, lat, lon, tz) for d in dates}
+
 
 class TestPanchangamCore:
     """Test cases for panchangam core calculations."""
     
     def test_compute_tithi_basic(self):
         """Test basic tithi calculations."""
-        # Test known tithi calculations
-        # These are approximate values for testing
-        
-        # Test tithi 1 (Shukla Pratipada)
-        tithi_num, tithi_progress = compute_tithi(0.0, 12.0)  # Sun at 0°, Moon at 12°
-        assert tithi_num == 1
-        assert 0.0 <= tithi_progress <= 1.0
-        
-        # Test tithi 15 (Purnima)
-        tithi_num, tithi_progress = compute_tithi(0.0, 180.0)  # Sun at 0°, Moon at 180°
-        assert tithi_num == 15
-        assert 0.0 <= tithi_progress <= 1.0
-        
-        # Test tithi 30 (Amavasya)
-        tithi_num, tithi_progress = compute_tithi(0.0, 0.0)  # Sun and Moon at same position
-        assert tithi_num == 1  # Should be 1, not 30, as 0° difference = 0 tithi
-        assert 0.0 <= tithi_progress <= 1.0
-        
-        # Test tithi 16 (Krishna Pratipada)
-        tithi_num, tithi_progress = compute_tithi(0.0, 192.0)  # Sun at 0°, Moon at 192°
-        assert tithi_num == 16
-        assert 0.0 <= tithi_progress <= 1.0
+        # Known tithi calculations, approximate values for testing:
+        # Shukla Pratipada, Purnima, Sun and Moon together (0° difference is
+        # tithi 1, not 30) and Krishna Pratipada
+        sun = np.array([0.0, 0.0, 0.0, 0.0])
+        moon = np.array([12.0, 180.0, 0.0, 192.0])
+        
+        tithi_nums, tithi_progress = compute_tithi_vec(sun, moon)
+        np.testing.assert_array_equal(tithi_nums, [1, 15, 1, 16])
+        assert np.all((0.0 <= tithi_progress) & (tithi_progress <= 1.0))
+        
+        # The scalar function agrees
+        assert [compute_tithi(s, m)[0] for s, m in zip(sun, moon)] == tithi_nums.tolist()
     
     def test_compute_nakshatra_basic(self):
         """Test basic nakshatra calculations."""
-        # Test nakshatra 1 (Ashwini)
-        nakshatra_num, nakshatra_progress = compute_nakshatra(0.0)
-        assert nakshatra_num == 1
-        assert 0.0 <= nakshatra_progress <= 1.0
-        
-        # Test nakshatra 14 (Chitra)
-        nakshatra_num, nakshatra_progress = compute_nakshatra(180.0)
-        assert nakshatra_num == 14
-        assert 0.0 <= nakshatra_progress <= 1.0
-        
-        # Test nakshatra 27 (Revati)
-        nakshatra_num, nakshatra_progress = compute_nakshatra(350.0)
-        assert nakshatra_num == 27
-        assert 0.0 <= nakshatra_progress <= 1.0
+        # Ashwini, Chitra, Revati
+        moon = np.array([0.0, 180.0, 350.0])
+        
+        nakshatra_nums, nakshatra_progress = compute_nakshatra_vec(moon)
+        np.testing.assert_array_equal(nakshatra_nums, [1, 14, 27])
+        assert np.all((0.0 <= nakshatra_progress) & (nakshatra_progress <= 1.0))
+        
+        # The scalar function agrees
+        assert [compute_nakshatra(m)[0] for m in moon] == nakshatra_nums.tolist()
     
     def test_compute_yoga_basic(self):
         """Test basic yoga calculations."""
-        # Test yoga 1 (Vishkambha)
-        yoga_num, yoga_progress = compute_yoga(0.0, 0.0)  # Sun and Moon at 0°
-        assert yoga_num == 1
-        assert 0.0 <= yoga_progress <= 1.0
-        
-        # Test yoga 14 (Vyaghata)
-        yoga_num, yoga_progress = compute_yoga(90.0, 90.0)  # Sun and Moon at 90°
-        assert yoga_num == 14
-        assert 0.0 <= yoga_progress <= 1.0
-        
-        # Test yoga 27 (Vaidhriti)
-        yoga_num, yoga_progress = compute_yoga(180.0, 180.0)  # Sun and Moon at 180°
-        assert yoga_num == 27
-        assert 0.0 <= yoga_progress <= 1.0
+        # Vishkambha, Vyaghata, Vaidhriti with Sun and Moon together
+        sun = np.array([0.0, 90.0, 180.0])
+        moon = np.array([0.0, 90.0, 180.0])
+        
+        yoga_nums, yoga_progress = compute_yoga_vec(sun, moon)
+        np.testing.assert_array_equal(yoga_nums, [1, 14, 27])
+        assert np.all((0.0 <= yoga_progress) & (yoga_progress <= 1.0))
+        
+        # The scalar function agrees
+        assert [compute_yoga(s, m)[0] for s, m in zip(sun, moon)] == yoga_nums.tolist()
     
     def test_compute_karana_basic(self):
         """Test basic karana calculations."""
         # Test regular karanas (1-7)
         karana_name, karana_progress = compute_karana(1, 0.0)
-        assert karana_name in ["Bava", "Balava", "Kaulava", "Taitila", "Garija", "Vanija", "Vishti"]
+        assert karana_name in _REGULAR_KARANAS
         assert 0.0 <= karana_progress <= 1.0
         
         # Test special karanas (9-11) on specific tithis
         karana_name, karana_progress = compute_karana(1, 0.0)  # Tithi 1
-        assert karana_name in ["Chatushpada", "Naga"]
+        assert karana_name in _SPECIAL_KARANAS_T1
         assert 0.0 <= karana_progress <= 1.0
         
         karana_name, karana_progress = compute_karana(2, 0.0)  # Tithi 2
-        assert karana_name in ["Naga", "Kimstughna"]
+        assert karana_name in _SPECIAL_KARANAS_T2
         assert 0.0 <= karana_progress <= 1.0
     
+    def test_vectorized_elements_match_scalar(self):
+        """Test that the array kernels agree with the scalar functions."""
+        sun = np.linspace(0.0, 359.5, 97)
+        moon = (sun * 13.37 + 41.0) % 360.0
+
+        tithi_nums, tithi_progress = compute_tithi_vec(sun, moon)
+        nakshatra_nums, _ = compute_nakshatra_vec(moon)
+        yoga_nums, _ = compute_yoga_vec(sun, moon)
+        karana_idx, karana_progress = compute_karana_vec(tithi_nums, tithi_progress)
+
+        for i in range(len(sun)):
+            tithi_num, progress = compute_tithi(sun[i], moon[i])
+            assert tithi_nums[i] == tithi_num
+            assert tithi_progress[i] == pytest.approx(progress)
+            assert nakshatra_nums[i] == compute_nakshatra(moon[i])[0]
+            assert yoga_nums[i] == compute_yoga(sun[i], moon[i])[0]
+            karana_name, karana_prog = compute_karana(tithi_num, progress)
+            assert KARANAS[karana_idx[i]] == karana_name
+            assert karana_progress[i] == pytest.approx(karana_prog)
+
     def test_sunrise_sunset_bounds(self):
         """Test sunrise/sunset time bounds for different locations."""
         # Test Chennai (13.0827°N, 80.2707°E)
@@ -133,7 +153,48 @@ class TestPanchangamCore:
         
         # Sunset should be between 5:00 PM and 6:30 PM IST
         assert 17.0 <= sunset.hour + sunset.minute/60.0 <= 18.5
-    
+
+    def test_year_sun_events(self):
+        """Test that the year-long search matches the per-day calculation."""
+        lat, lon, tz = 13.0827, 80.2707, "Asia/Kolkata"
+        events = get_year_sun_events(2024, lat, lon, tz)
+
+        # Chennai sees a sunrise and sunset every day of the (leap) year
+        assert len(events) == 366
+        assert events[0][0].date() == date(2024, 1, 1)
+        assert events[-1][0].date() == date(2024, 12, 31)
+
+        # Each pair should agree with the single-day calculation
+        sunrise, sunset = get_sunrise_sunset(date(2024, 3, 15), lat, lon, tz, high_precision=True)
+        year_sunrise, year_sunset = events[date(2024, 3, 15).timetuple().tm_yday - 1]
+        assert abs((year_sunrise - sunrise).total_seconds()) < 1
+        assert abs((year_sunset - sunset).total_seconds()) < 1
+
+    def test_fast_sunrise_sunset_accuracy(self):
+        """Test the closed-form sunrise/sunset against the ephemeris search."""
+        for test_date, lat, lon, tz in [
+            (date(2024, 3, 15), 13.0827, 80.2707, "Asia/Kolkata"),   # Chennai
+            (date(2024, 6, 21), 28.7041, 77.1025, "Asia/Kolkata"),   # Delhi, solstice
+            (date(2024, 12, 21), 51.5074, -0.1278, "Europe/London"), # London, solstice
+        ]:
+            fast = get_sunrise_sunset(test_date, lat, lon, tz)
+            precise = get_sunrise_sunset(test_date, lat, lon, tz, high_precision=True)
+            for approx, exact in zip(fast, precise):
+                assert abs((approx - exact).total_seconds()) < 120
+
+    def test_fast_sunrise_sunset_batch(self):
+        """Test the vectorized closed form against the scalar one."""
+        dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(0, 366, 7)]
+        sunrises, sunsets = fast_sunrise_sunset_batch(dates, 13.0827, 80.2707)
+        for d, sr64, ss64 in zip(dates, sunrises, sunsets):
+            sunrise, sunset = fast_sunrise_sunset(d, 13.0827, 80.2707)
+            assert abs(sr64 - np.datetime64(sunrise.replace(tzinfo=None), 'us')) <= np.timedelta64(1, 'ms')
+            assert abs(ss64 - np.datetime64(sunset.replace(tzinfo=None), 'us')) <= np.timedelta64(1, 'ms')
+
+        # Tromsø in midwinter: no sunrise at all
+        sunrises, sunsets = fast_sunrise_sunset_batch([date(2024, 12, 21)], 69.6492, 18.9553)
+        assert np.isnat(sunrises[0]) and np.isnat(sunsets[0])
+
     def test_rahu_yama_gulikai_timing(self):
         """Test Rahu Kalam, Yama Gandam, and Gulikai Kalam timing."""
         test_date = date(2024, 3, 15)  # Friday
@@ -178,8 +239,7 @@ class TestPanchangamCore:
             assert "duration" in hora
             
             # Check that planets are valid
-            valid_planets = ["Sun", "Venus", "Mercury", "Moon", "Saturn", "Jupiter", "Mars"]
-            assert hora["planet"] in valid_planets
+            assert hora["planet"] in _VALID_PLANETS
         
         # Check that horas are sequential
         for i in range(len(horas) - 1):
@@ -287,33 +347,19 @@ class TestPanchangamCore:
             assert "start" in hora
             assert "end" in hora
     
-    def test_known_dates_sanity(self):
+    @pytest.mark.parametrize("test_date,expected_tithis", [
+        # Diwali: Krishna Chaturdashi at day start, Amavasya from that afternoon
+        pytest.param(date(2024, 10, 31), {29, 30}, id="diwali"),
+        # Holi: Purnima
+        pytest.param(date(2024, 3, 25), {15}, id="holi"),
+        # Maha Shivaratri: Krishna Trayodashi at day start, Chaturdashi by night
+        pytest.param(date(2024, 3, 8), {28, 29}, id="shivaratri"),
+    ])
+    def test_known_dates_sanity(self, test_date, expected_tithis):
         """Test panchangam calculations for known important dates."""
-        # Test Diwali 2024 (October 31, 2024)
-        diwali_date = date(2024, 10, 31)
-        lat, lon, tz = 13.0827, 80.2707, "Asia/Kolkata"  # Chennai
-        
-        panchangam = assemble_panchangam(diwali_date, lat, lon, tz)
-        
-        # Diwali should be on Amavasya (tithi 30 or 15 Krishna)
-        tithi = panchangam["tithi"]
-        assert tithi["number"] in [15, 30]  # Could be either depending on exact timing
+        panchangam = assemble_panchangam(test_date, 13.0827, 80.2707, "Asia/Kolkata")  # Chennai
         
-        # Test Holi 2024 (March 25, 2024)
-        holi_date = date(2024, 3, 25)
-        panchangam = assemble_panchangam(holi_date, lat, lon, tz)
-        
-        # Holi should be on Purnima (tithi 15)
-        tithi = panchangam["tithi"]
-        # Note: This is approximate as exact dates depend on precise calculations
-        
-        # Test Maha Shivaratri 2024 (March 8, 2024)
-        shivaratri_date = date(2024, 3, 8)
-        panchangam = assemble_panchangam(shivaratri_date, lat, lon, tz)
-        
-        # Maha Shivaratri should be on Krishna 14
-        tithi = panchangam["tithi"]
-        # Note: This is approximate as exact dates depend on precise calculations
+        assert panchangam["tithi"]["number"] in expected_tithis
     
     def test_edge_cases(self):
         """Test edge cases and boundary conditions."""
@@ -364,35 +410,25 @@ class TestPanchangamCore:
         assert sun_long != float('inf')
         assert moon_long != float('inf')
     
-    def test_performance_basic(self):
+    def test_performance_basic(self, benchmark):
         """Test basic performance of panchangam calculations."""
-        import time
-        
         test_date = date(2024, 3, 15)
         lat, lon, tz = 13.0827, 80.2707, "Asia/Kolkata"
         
-        # Time a single panchangam calculation
-        start_time = time.time()
-        panchangam = assemble_panchangam(test_date, lat, lon, tz)
-        end_time = time.time()
-        
-        calculation_time = end_time - start_time
-        
-        # Should complete within reasonable time (less than 5 seconds)
-        assert calculation_time < 5.0, f"Panchangam calculation took {calculation_time:.2f} seconds"
+        benchmark.group = "assemble_panchangam"
+        benchmark.extra_info["threshold"] = 2.0
         
-        # Time multiple calculations
-        start_time = time.time()
-        for i in range(10):
-            test_date_iter = date(2024, 3, 15 + i)
-            assemble_panchangam(test_date_iter, lat, lon, tz)
-        end_time = time.time()
+        # Clear the result cache before each round so the compute is timed
+        panchangam = benchmark.pedantic(
+            assemble_panchangam, args=(test_date, lat, lon, tz),
+            setup=assemble_panchangam.cache_clear, rounds=10, warmup_rounds=1
+        )
         
-        avg_time = (end_time - start_time) / 10
-        
-        # Average time should be reasonable
-        assert avg_time < 2.0, f"Average panchangam calculation took {avg_time:.2f} seconds"
-
+        assert panchangam["date"] == test_date.isoformat()
+        # No stats when benchmarking is disabled (e.g. under xdist)
+        if benchmark.stats is not None:
+            median = benchmark.stats.stats.median
+            assert median < 2.0, f"Median panchangam calculation took {median:.2f} seconds"
 
 class TestPanchangamIntegration:
     """Integration tests for panchangam functionality."""
@@ -423,25 +459,21 @@ class TestPanchangamIntegration:
             assert panchangam["location"]["longitude"] == lon
             assert panchangam["location"]["timezone"] == tz
     
-    def test_date_range_consistency(self):
+    @pytest.mark.parametrize("offset", range(30))  # Test 30 days
+    def test_date_range_consistency(self, panchangam_jan2024, offset):
         """Test consistency across a range of dates."""
-        start_date = date(2024, 1, 1)
-        lat, lon, tz = 13.0827, 80.2707, "Asia/Kolkata"
+        test_date = date(2024, 1, 1) + timedelta(days=offset)
+        panchangam = panchangam_jan2024[test_date]
         
-        for i in range(30):  # Test 30 days
-            test_date = start_date + timedelta(days=i)
-            panchangam = assemble_panchangam(test_date, lat, lon, tz)
-            
-            # Each date should produce valid panchangam
-            assert panchangam["date"] == test_date.isoformat()
-            assert "tithi" in panchangam
-            assert "nakshatra" in panchangam
-            
-            # Tithi should progress logically
-            tithi = panchangam["tithi"]
-            assert 1 <= tithi["number"] <= 30
-            assert 0.0 <= tithi["progress"] <= 1.0
-
+        # Each date should produce valid panchangam
+        assert panchangam["date"] == test_date.isoformat()
+        assert "tithi" in panchangam
+        assert "nakshatra" in panchangam
+        
+        # Tithi should progress logically
+        tithi = panchangam["tithi"]
+        assert 1 <= tithi["number"] <= 30
+        assert 0.0 <= tithi["progress"] <= 1.0
 
 if __name__ == "__main__":
     # Run tests if executed directly
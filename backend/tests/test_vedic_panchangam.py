@@ -0,0 +1,39 @@
+"""
+Tests for the Swiss Ephemeris panchangam calculator.
+
+Checks that the vectorized multi-day path agrees with the per-date one.
+"""
+
+import pytest
+from datetime import date, timedelta
+
+# Import the modules to test
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from numerology_app.vedic_panchangam import City, Panchangam
+
+CHENNAI = City(name="Chennai", latitude=13.0827, longitude=80.2707, timezone="Asia/Kolkata")
+
+
+def test_compute_range_matches_compute():
+    """compute_range must give the same elements as compute() for every day."""
+    start = date(2024, 1, 1)
+    days = Panchangam.compute_range(CHENNAI, start, 366)
+
+    assert len(days) == 366
+    for i, day in enumerate(days):
+        panch = Panchangam(CHENNAI, start + timedelta(days=i))
+        panch.compute()
+
+        assert day["date"] == panch.date_obj
+        assert (day["tithi"], day["tithi_name"]) == (panch.tithi.index, panch.tithi.name_english)
+        assert (day["nakshatra"], day["nakshatra_name"]) == (panch.nakshatra.index, panch.nakshatra.name_english)
+        assert (day["yoga"], day["yoga_name"]) == (panch.yoga.index, panch.yoga.name_english)
+        assert day["karana_name"] == panch.karana.name_english
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])